@@ -13,14 +13,19 @@ Usage:
     uv run python .claude/scripts/generate_bundles.py
     uv run python .claude/scripts/generate_bundles.py --agent python-code-writer
     uv run python .claude/scripts/generate_bundles.py --dry-run
+    uv run python .claude/scripts/generate_bundles.py --force
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import json
+import os
 import re
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -28,19 +33,29 @@ from typing import Any, Final
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 CLAUDE_DIR: Final[Path] = Path(__file__).parent.parent
 SKILLS_DIR: Final[Path] = CLAUDE_DIR / "skills"
 MANIFEST_PATH: Final[Path] = CLAUDE_DIR / "manifest.json"
 BUNDLES_DIR: Final[Path] = CLAUDE_DIR / "bundles"
 
 FRONTMATTER_PATTERN: Final[re.Pattern[str]] = re.compile(r"^---\n(.*?)\n---\n", re.DOTALL)
-QUICK_REFERENCE_PATTERN: Final[re.Pattern[str]] = re.compile(r"(## Quick Reference\n.*?)(?=\n## |\Z)", re.DOTALL)
+QUICK_REFERENCE_HEADING: Final[str] = "## Quick Reference\n"
+GENERATED_LINE_PATTERN: Final[re.Pattern[bytes]] = re.compile(rb"^Generated: .*$", re.MULTILINE)
+
+MAX_SKILL_LOADERS: Final[int] = 8
 
 
-@dataclass
+@dataclass(frozen=True)
 class SkillContent:
     """Container for skill content with optional layers.
 
+    Instances are cached and shared between bundles, so they are frozen.
+
     Attributes:
         main_content (str): The main SKILL.md content (without frontmatter).
         layers (dict[str, str]): Dict mapping layer names to their content.
@@ -58,6 +73,24 @@ class SkillContent:
         """
         return bool(self.layers)
 
+    @functools.cached_property
+    def quick_reference(self) -> str | None:
+        """Quick Reference section of the main content, extracted on first access.
+
+        Returns:
+            str | None: Quick Reference section if found, None otherwise.
+        """
+        return extract_quick_reference(self.main_content)
+
+    @functools.cached_property
+    def ordered_layers(self) -> list[tuple[str, str]]:
+        """Layers in bundle order (rules, examples, then alphabetical), sorted on first access.
+
+        Returns:
+            list[tuple[str, str]]: List of (layer_name, content) tuples in priority order.
+        """
+        return _order_layers(self.layers)
+
 
 def load_manifest() -> dict[str, Any]:
     """Load the manifest.json file.
@@ -65,35 +98,51 @@ def load_manifest() -> dict[str, Any]:
     Returns:
         dict[str, Any]: The parsed manifest data.
     """
-    with MANIFEST_PATH.open() as f:
-        return json.load(f)
+    return json.loads(MANIFEST_PATH.read_bytes())
 
 
-def _parse_frontmatter(content: str) -> dict[str, Any]:
-    """Parse YAML frontmatter from markdown content.
+def read_text(path: Path) -> str:
+    """Read a UTF-8 text file with LF line endings.
 
     Args:
-        content (str): Markdown content that may contain frontmatter.
+        path (Path): File to read.
 
     Returns:
-        dict[str, Any]: Parsed frontmatter data, or empty dict if none found.
+        str: The decoded file content.
     """
-    if match := FRONTMATTER_PATTERN.match(content):
-        yaml_content = match.group(1)
-        return yaml.safe_load(yaml_content) or {}
-    return {}
+    # read_bytes skips Path.read_text's newline translation, so fold CRLF to LF here
+    return path.read_bytes().decode("utf-8").replace("\r\n", "\n")
 
 
-def _remove_frontmatter(content: str) -> str:
-    """Remove YAML frontmatter from markdown content.
+def load_yaml(text: str) -> Any:
+    """Parse YAML with the safe loader, backed by libyaml when PyYAML was built with it.
+
+    Args:
+        text (str): YAML document to parse.
+
+    Returns:
+        Any: The parsed document, or None if it is empty.
+    """
+    return yaml.load(text, Loader=_YamlLoader)
+
+
+def _split_frontmatter(content: str) -> tuple[dict[str, Any], str]:
+    """Split markdown content into parsed YAML frontmatter and the remaining body.
+
+    A single pattern match yields both the YAML block and the offset where the
+    body starts, so the content is only scanned once.
 
     Args:
         content (str): Markdown content that may contain frontmatter.
 
     Returns:
-        str: Content with frontmatter removed.
+        tuple[dict[str, Any], str]: Tuple of (frontmatter dict, content without
+            frontmatter). The dict is empty and the content unchanged if no
+            frontmatter is found.
     """
-    return FRONTMATTER_PATTERN.sub("", content)
+    if match := FRONTMATTER_PATTERN.match(content):
+        return load_yaml(match.group(1)) or {}, content[match.end() :]
+    return {}, content
 
 
 def _load_layer_files(skill_dir: Path, layers_config: dict[str, str]) -> dict[str, str]:
@@ -109,31 +158,61 @@ def _load_layer_files(skill_dir: Path, layers_config: dict[str, str]) -> dict[st
     layers: dict[str, str] = {}
     for layer_name, filename in layers_config.items():
         layer_path = skill_dir / filename
-        if layer_path.exists():
-            layers[layer_name] = layer_path.read_text().strip()
-        else:
+        content = _read_layer(layer_path)
+        if content is None:
             print(f"  Warning: Layer file not found: {layer_path}")
+        else:
+            layers[layer_name] = content
     return layers
 
 
+def _read_layer(layer_path: Path) -> str | None:
+    """Read a single layer file.
+
+    Args:
+        layer_path (Path): Path to the layer file.
+
+    Returns:
+        str | None: Stripped layer content, or None if the file does not exist.
+    """
+    try:
+        return read_text(layer_path).strip()
+    except FileNotFoundError:
+        return None
+
+
 def load_skill_content(skill_name: str) -> SkillContent | None:
     """Load the content of a skill including any layers.
 
+    Results are cached per skill directory, so a skill shared by several
+    agents (and by both the full and compact bundles) is read from disk once.
+
     Args:
         skill_name (str): Name of the skill directory.
 
     Returns:
         SkillContent | None: The skill content with layers, or None if not found.
     """
-    skill_dir = SKILLS_DIR / skill_name
-    skill_path = skill_dir / "SKILL.md"
-    if not skill_path.exists():
-        print(f"  Warning: Skill not found: {skill_name}")
+    return _load_skill_dir(SKILLS_DIR / skill_name)
+
+
+@functools.cache
+def _load_skill_dir(skill_dir: Path) -> SkillContent | None:
+    """Read and parse a skill directory, memoized by path.
+
+    Args:
+        skill_dir (Path): Path to the skill directory.
+
+    Returns:
+        SkillContent | None: The skill content with layers, or None if not found.
+    """
+    try:
+        content = read_text(skill_dir / "SKILL.md")
+    except FileNotFoundError:
         return None
 
-    content = skill_path.read_text()
-    frontmatter = _parse_frontmatter(content)
-    main_content = _remove_frontmatter(content).strip()
+    frontmatter, body = _split_frontmatter(content)
+    main_content = body.strip()
 
     layers_config = frontmatter.get("layers", {})
     layers = _load_layer_files(skill_dir, layers_config) if layers_config else {}
@@ -144,15 +223,25 @@ def load_skill_content(skill_name: str) -> SkillContent | None:
 def extract_quick_reference(content: str) -> str | None:
     """Extract just the Quick Reference section from skill content.
 
+    The section runs from its heading line to the next level-two heading (or
+    the end of the content), without trailing whitespace.
+
     Args:
         content (str): Full skill content.
 
     Returns:
         str | None: Quick Reference section if found, None otherwise.
     """
-    if match := QUICK_REFERENCE_PATTERN.search(content):
-        return match.group(1).strip()
-    return None
+    # The heading only counts at the start of a line
+    if content.startswith(QUICK_REFERENCE_HEADING):
+        start = 0
+    else:
+        start = content.find(f"\n{QUICK_REFERENCE_HEADING}") + 1
+        if not start:
+            return None
+
+    end = content.find("\n## ", start)
+    return content[start : end if end != -1 else None].rstrip()
 
 
 def _order_layers(layers: dict[str, str]) -> list[tuple[str, str]]:
@@ -173,105 +262,156 @@ def _order_layers(layers: dict[str, str]) -> list[tuple[str, str]]:
     return [*priority_layers, *other_layers]
 
 
-def _format_layers(skill_name: str, layers: dict[str, str]) -> list[str]:
-    """Format layer content for inclusion in a bundle.
-
-    Layers are formatted in a consistent order: rules first, then examples,
-    then any other layers alphabetically.
+def _format_layers(buf: io.StringIO, skill_name: str, ordered_layers: list[tuple[str, str]]) -> None:
+    """Write layer content for inclusion in a bundle.
 
     Args:
+        buf (io.StringIO): Buffer the bundle is written into.
         skill_name (str): Name of the skill (for headers).
-        layers (dict[str, str]): Dict mapping layer names to their content.
-
-    Returns:
-        list[str]: Lines for the layer sections.
-    """
-    if not layers:
-        return []
-
-    lines: list[str] = []
-    for layer_name, layer_content in _order_layers(layers):
-        lines.extend([
-            f"<!-- {skill_name}/{layer_name} -->",
-            "",
-            layer_content,
-            "",
-        ])
-    return lines
+        ordered_layers (list[tuple[str, str]]): (layer_name, content) pairs in output order.
+    """
+    for layer_name, layer_content in ordered_layers:
+        buf.write(f"<!-- {skill_name}/{layer_name} -->\n\n{layer_content}\n\n")
 
 
-def _build_bundle_header(agent_name: str, timestamp: str) -> list[str]:
-    """Build the header section of a bundle.
+def _build_bundle_header(buf: io.StringIO, agent_name: str, timestamp: str) -> None:
+    """Write the header section of a bundle.
 
     Args:
+        buf (io.StringIO): Buffer the bundle is written into.
         agent_name (str): Name of the agent.
         timestamp (str): ISO format timestamp.
-
-    Returns:
-        list[str]: Lines for the bundle header.
     """
-    return [
-        f"# {agent_name} Context Bundle",
-        "",
-        "Auto-generated from manifest.json dependencies.",
-        f"Generated: {timestamp}",
-        "",
-        "---",
-        "",
-    ]
+    buf.write(
+        f"# {agent_name} Context Bundle\n\n"
+        "Auto-generated from manifest.json dependencies.\n"
+        f"Generated: {timestamp}\n\n"
+        "---\n\n"
+    )
 
 
 def _build_table_of_contents(
+    buf: io.StringIO,
     dependencies: list[str],
     skills_lookup: Mapping[str, Mapping[str, Any]],
-) -> list[str]:
-    """Build the table of contents section listing included skills.
+) -> None:
+    """Write the table of contents section listing included skills.
 
     Args:
+        buf (io.StringIO): Buffer the bundle is written into.
         dependencies (list[str]): List of skill names.
         skills_lookup (Mapping[str, Mapping[str, Any]]): Skill name to config mapping.
-
-    Returns:
-        list[str]: Lines for the table of contents.
     """
-    lines = ["## Included Skills", ""]
+    buf.write("## Included Skills\n\n")
     for skill_name in dependencies:
         skill_config = skills_lookup.get(skill_name, {})
         description = skill_config.get("description", "")
-        lines.append(f"- **{skill_name}**: {description}")
-    lines.extend(["", "---", ""])
-    return lines
+        buf.write(f"- **{skill_name}**: {description}\n")
+    buf.write("\n---\n\n")
 
 
-def _format_skill_section(skill_name: str, skill: SkillContent, *, compact: bool) -> list[str]:
-    """Format a single skill's content for inclusion in a bundle.
+def _format_skill_section(buf: io.StringIO, skill_name: str, skill: SkillContent, *, compact: bool) -> None:
+    """Write a single skill's content for inclusion in a bundle.
 
     For compact bundles, only the Quick Reference section is included.
     For full bundles, the main content is included followed by any layers.
 
     Args:
+        buf (io.StringIO): Buffer the bundle is written into.
         skill_name (str): Name of the skill.
         skill (SkillContent): The skill content with optional layers.
         compact (bool): If True, only include Quick Reference sections.
-
-    Returns:
-        list[str]: Lines for the skill section.
     """
     if compact:
-        quick_ref = extract_quick_reference(skill.main_content)
-        if quick_ref:
-            return [f"## {skill_name}", "", quick_ref, "", "---", ""]
-        # Fall back to full content if no Quick Reference
-        return [skill.main_content, "", "---", ""]
+        if skill.quick_reference:
+            buf.write(f"## {skill_name}\n\n{skill.quick_reference}\n\n---\n\n")
+        else:
+            # Fall back to full content if no Quick Reference
+            buf.write(f"{skill.main_content}\n\n---\n\n")
+        return
 
     # Full bundle: add skill name as context header, then main content, then layers
-    lines = [f"<!-- skill: {skill_name} -->", "", skill.main_content, ""]
+    buf.write(f"<!-- skill: {skill_name} -->\n\n{skill.main_content}\n\n")
 
     if skill.has_layers:
-        lines.extend(_format_layers(skill_name, skill.layers))
+        _format_layers(buf, skill_name, skill.ordered_layers)
+
+    buf.write("---\n\n")
+
+
+def _load_dependencies(dependencies: list[str]) -> dict[str, SkillContent]:
+    """Load the content of each dependency, skipping skills that are missing.
+
+    Missing skills are reported for every agent that depends on them, even
+    though the failed lookup itself is cached.
+
+    Args:
+        dependencies (list[str]): List of skill names.
+
+    Returns:
+        dict[str, SkillContent]: Skill name to content mapping, in dependency order.
+    """
+    loaded_skills: dict[str, SkillContent] = {}
+    for skill_name in dependencies:
+        skill = load_skill_content(skill_name)
+        if skill is None:
+            print(f"  Warning: Skill not found: {skill_name}")
+        else:
+            loaded_skills[skill_name] = skill
+    return loaded_skills
+
+
+def _render_preamble(
+    agent_name: str,
+    loaded_skills: Mapping[str, SkillContent],
+    skills_lookup: Mapping[str, Mapping[str, Any]],
+    timestamp: str,
+) -> str:
+    """Render the header and table of contents shared by an agent's full and compact bundles.
+
+    Args:
+        agent_name (str): Name of the agent.
+        loaded_skills (Mapping[str, SkillContent]): Skill name to content mapping.
+        skills_lookup (Mapping[str, Mapping[str, Any]]): Skill name to config mapping.
+        timestamp (str): ISO format timestamp.
+
+    Returns:
+        str: The rendered header and table of contents.
+    """
+    buf = io.StringIO()
+    _build_bundle_header(buf, agent_name, timestamp)
+    _build_table_of_contents(buf, list(loaded_skills.keys()), skills_lookup)
+    return buf.getvalue()
+
+
+def _render_bundle(preamble: str, loaded_skills: Mapping[str, SkillContent], *, compact: bool) -> str:
+    """Render a bundle from its preamble and already-loaded skill content.
+
+    Args:
+        preamble (str): Rendered header and table of contents.
+        loaded_skills (Mapping[str, SkillContent]): Skill name to content mapping.
+        compact (bool): If True, only include Quick Reference sections.
+
+    Returns:
+        str: The rendered bundle content.
+    """
+    buf = io.StringIO()
+    buf.write(preamble)
+
+    for skill_name, skill in loaded_skills.items():
+        _format_skill_section(buf, skill_name, skill, compact=compact)
+
+    # Every section ends with a blank line; the bundle itself ends after its final separator
+    return buf.getvalue().removesuffix("\n")
 
-    lines.extend(["---", ""])
-    return lines
+
+def _timestamp() -> str:
+    """Return the current UTC time formatted for bundle headers.
+
+    Returns:
+        str: ISO format timestamp.
+    """
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def generate_bundle(
@@ -292,25 +432,35 @@ def generate_bundle(
     Returns:
         str: The generated bundle content.
     """
-    dependencies: list[str] = agent_config.get("depends_on_skills", [])
-    timestamp = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-
     # Load skills first to filter missing ones from both TOC and content
-    loaded_skills: dict[str, SkillContent] = {}
-    for skill_name in dependencies:
-        skill = load_skill_content(skill_name)
-        if skill is not None:
-            loaded_skills[skill_name] = skill
+    loaded_skills = _load_dependencies(agent_config.get("depends_on_skills", []))
+    preamble = _render_preamble(agent_name, loaded_skills, skills_lookup, _timestamp())
+    return _render_bundle(preamble, loaded_skills, compact=compact)
 
-    lines: list[str] = [
-        *_build_bundle_header(agent_name, timestamp),
-        *_build_table_of_contents(list(loaded_skills.keys()), skills_lookup),
-    ]
 
-    for skill_name, skill in loaded_skills.items():
-        lines.extend(_format_skill_section(skill_name, skill, compact=compact))
+def _generate_bundles_for_agent(
+    agent_name: str,
+    agent_config: Mapping[str, Any],
+    skills_lookup: Mapping[str, Mapping[str, Any]],
+) -> tuple[str, str]:
+    """Generate both the full and compact bundles for an agent.
+
+    Dependencies are loaded, and the header and table of contents rendered,
+    once and shared by both renderings.
+
+    Args:
+        agent_name (str): Name of the agent.
+        agent_config (Mapping[str, Any]): Agent configuration from manifest.
+        skills_lookup (Mapping[str, Mapping[str, Any]]): Skill name to config mapping.
 
-    return "\n".join(lines)
+    Returns:
+        tuple[str, str]: Tuple of (full bundle, compact bundle).
+    """
+    loaded_skills = _load_dependencies(agent_config.get("depends_on_skills", []))
+    preamble = _render_preamble(agent_name, loaded_skills, skills_lookup, _timestamp())
+    full_content = _render_bundle(preamble, loaded_skills, compact=False)
+    compact_content = _render_bundle(preamble, loaded_skills, compact=True)
+    return full_content, compact_content
 
 
 def _build_skills_lookup(manifest: Mapping[str, Any]) -> dict[str, dict[str, Any]]:
@@ -328,14 +478,43 @@ def _build_skills_lookup(manifest: Mapping[str, Any]) -> dict[str, dict[str, Any
 def _write_bundle(path: Path, content: str) -> None:
     """Write bundle content to file and print status.
 
+    The write is skipped when the existing file differs only in its
+    ``Generated:`` timestamp, so regenerating unchanged bundles leaves the
+    files, including their modification times, untouched.
+
     Args:
         path (Path): Path to write the bundle file.
         content (str): Bundle content to write.
     """
-    path.write_text(content, encoding="utf-8")
+    data = content.encode("utf-8")
+    if _is_bundle_unchanged(path, data):
+        print(f"  Unchanged: {path.relative_to(CLAUDE_DIR)}")
+        return
+
+    path.write_bytes(data)
     print(f"  Wrote: {path.relative_to(CLAUDE_DIR)}")
 
 
+def _is_bundle_unchanged(path: Path, data: bytes) -> bool:
+    """Check whether a bundle on disk matches new content, ignoring its timestamp.
+
+    Args:
+        path (Path): Path of the existing bundle file.
+        data (bytes): Encoded new bundle content.
+
+    Returns:
+        bool: True if the file exists and differs at most in its ``Generated:`` line.
+    """
+    try:
+        # Timestamps have a fixed width, so a size mismatch is a real change
+        if path.stat().st_size != len(data):
+            return False
+        existing = path.read_bytes()
+    except FileNotFoundError:
+        return False
+    return GENERATED_LINE_PATTERN.sub(b"", existing, count=1) == GENERATED_LINE_PATTERN.sub(b"", data, count=1)
+
+
 def _process_agent(
     agent_config: Mapping[str, Any],
     skills_lookup: Mapping[str, Mapping[str, Any]],
@@ -355,8 +534,7 @@ def _process_agent(
     print(f"\nGenerating bundle for: {agent_name}")
     print(f"  Dependencies: {len(dependencies)} skills")
 
-    full_content = generate_bundle(agent_name, agent_config, skills_lookup, compact=False)
-    compact_content = generate_bundle(agent_name, agent_config, skills_lookup, compact=True)
+    full_content, compact_content = _generate_bundles_for_agent(agent_name, agent_config, skills_lookup)
 
     if dry_run:
         print(f"  Would write: bundles/{agent_name}.md ({len(full_content)} chars)")
@@ -367,26 +545,178 @@ def _process_agent(
     _write_bundle(BUNDLES_DIR / f"{agent_name}-compact.md", compact_content)
 
 
-def generate_all_bundles(*, dry_run: bool = False, agent_filter: str | None = None) -> None:
+def generate_all_bundles(*, dry_run: bool = False, agent_filter: str | None = None, force: bool = False) -> None:
     """Generate bundles for all agents in the manifest.
 
+    Each run starts from an empty skill cache, so skills edited since a
+    previous run in the same process are re-read. Agents whose bundles are
+    newer than the manifest and every file of their skills are skipped
+    without rendering; the rest are rendered and only changed bundles are
+    written.
+
     Args:
         dry_run (bool): If True, print what would be generated without writing.
         agent_filter (str | None): If provided, only generate bundle for this agent.
+        force (bool): If True, regenerate bundles even when they are up to date.
     """
+    _load_skill_dir.cache_clear()
     manifest = load_manifest()
     skills_lookup = _build_skills_lookup(manifest)
 
     if not dry_run:
         BUNDLES_DIR.mkdir(exist_ok=True)
 
-    for agent_config in manifest.get("agents", []):
-        agent_name = agent_config["name"]
-        if agent_filter and agent_name != agent_filter:
-            continue
+    agent_configs = [
+        agent_config
+        for agent_config in manifest.get("agents", [])
+        if not agent_filter or agent_config["name"] == agent_filter
+    ]
+    if not (dry_run or force):
+        agent_configs = _drop_up_to_date(agent_configs)
+    if not agent_configs:
+        return
+    _prefetch_skills(agent_configs)
+
+    for agent_config in agent_configs:
         _process_agent(agent_config, skills_lookup, dry_run=dry_run)
 
 
+def find_stale_agents(manifest: Mapping[str, Any]) -> list[str]:
+    """Find the agents whose bundles are missing or differ from what would be generated now.
+
+    Bundles are compared by rendered content, ignoring the ``Generated:``
+    line, so a fresh checkout with byte-identical bundles reports nothing.
+
+    Args:
+        manifest (Mapping[str, Any]): The manifest data listing the agents.
+
+    Returns:
+        list[str]: Names of the agents with stale bundles, in manifest order.
+    """
+    _load_skill_dir.cache_clear()
+    skills_lookup = _build_skills_lookup(manifest)
+    return [
+        agent_config["name"]
+        for agent_config in manifest.get("agents", [])
+        if not _bundles_up_to_date(agent_config, skills_lookup)
+    ]
+
+
+def _drop_up_to_date(agent_configs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Report and filter out agents whose bundles are newer than all their inputs.
+
+    The remaining agents are rendered, and _write_bundle leaves any bundle
+    whose content turns out to be unchanged as it is.
+
+    Args:
+        agent_configs (list[dict[str, Any]]): Agent configurations from the manifest.
+
+    Returns:
+        list[dict[str, Any]]: The agents whose bundles are missing or stale, in manifest order.
+    """
+    stale: list[dict[str, Any]] = []
+    for agent_config in agent_configs:
+        agent_name: str = agent_config["name"]
+        if _bundles_newer_than_inputs(agent_name, agent_config.get("depends_on_skills", [])):
+            print(f"\nUp to date: bundles/{agent_name}.md, bundles/{agent_name}-compact.md")
+        else:
+            stale.append(agent_config)
+    return stale
+
+
+def _bundles_up_to_date(agent_config: Mapping[str, Any], skills_lookup: Mapping[str, Mapping[str, Any]]) -> bool:
+    """Check whether an agent's bundles on disk match what would be generated now.
+
+    Bundles newer than every input are taken as current without rendering.
+    Otherwise both bundles are rendered and compared with the files, ignoring
+    the ``Generated:`` line, so bundles whose inputs were merely touched (as
+    after a fresh clone or checkout) still count as current.
+
+    Args:
+        agent_config (Mapping[str, Any]): Agent configuration from manifest.
+        skills_lookup (Mapping[str, Mapping[str, Any]]): Skill name to config mapping.
+
+    Returns:
+        bool: True if both bundles exist and their content is current.
+    """
+    agent_name: str = agent_config["name"]
+    if _bundles_newer_than_inputs(agent_name, agent_config.get("depends_on_skills", [])):
+        return True
+
+    full_content, compact_content = _generate_bundles_for_agent(agent_name, agent_config, skills_lookup)
+    bundles = {f"{agent_name}.md": full_content, f"{agent_name}-compact.md": compact_content}
+    return all(_is_bundle_unchanged(BUNDLES_DIR / name, content.encode("utf-8")) for name, content in bundles.items())
+
+
+def _bundles_newer_than_inputs(agent_name: str, dependencies: list[str]) -> bool:
+    """Check whether an agent's bundles are newer than every input they are built from.
+
+    This is only a fast path: a False result means the bundles may be stale,
+    not that they are. Inputs are this script, the manifest and every file
+    and directory under each dependency's skill directory, so nested layer
+    files and removed files count as a change.
+
+    Args:
+        agent_name (str): Name of the agent.
+        dependencies (list[str]): Names of the skills the agent depends on.
+
+    Returns:
+        bool: True if both bundles exist and are strictly newer than all inputs.
+    """
+    try:
+        built = min(
+            (BUNDLES_DIR / f"{agent_name}.md").stat().st_mtime_ns,
+            (BUNDLES_DIR / f"{agent_name}-compact.md").stat().st_mtime_ns,
+        )
+        newest_input = max([
+            Path(__file__).stat().st_mtime_ns,
+            MANIFEST_PATH.stat().st_mtime_ns,
+            *(_newest_mtime(SKILLS_DIR / name) for name in dependencies),
+        ])
+    except FileNotFoundError:
+        # A missing bundle, manifest or skill always means regenerating (and reporting)
+        return False
+    return built > newest_input
+
+
+def _newest_mtime(directory: Path) -> int:
+    """Return the most recent modification time in a directory tree.
+
+    Args:
+        directory (Path): Directory to inspect.
+
+    Returns:
+        int: Newest ``st_mtime_ns`` among the directory and everything below it.
+    """
+    newest = directory.stat().st_mtime_ns
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                newest = max(newest, _newest_mtime(Path(entry.path)))
+            else:
+                newest = max(newest, entry.stat().st_mtime_ns)
+    return newest
+
+
+def _prefetch_skills(agent_configs: list[dict[str, Any]]) -> None:
+    """Load every skill the given agents depend on into the skill cache.
+
+    Each distinct skill is loaded once, concurrently, so the per-agent
+    bundle loop only performs in-memory lookups.
+
+    Args:
+        agent_configs (list[dict[str, Any]]): Agent configurations from the manifest.
+    """
+    needed = {skill_name for agent_config in agent_configs for skill_name in agent_config.get("depends_on_skills", [])}
+    if not needed:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_SKILL_LOADERS, len(needed))) as executor:
+        # Drain the iterator so any loader exception is raised here; missing
+        # skills are reported later, when each agent's bundle is rendered
+        list(executor.map(_load_skill_dir, (SKILLS_DIR / name for name in sorted(needed))))
+
+
 def _parse_args() -> argparse.Namespace:
     """Parse command-line arguments.
 
@@ -404,13 +734,18 @@ def _parse_args() -> argparse.Namespace:
         type=str,
         help="Generate bundle for a specific agent only.",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate bundles even if they are newer than the manifest and their skills.",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     """Entry point for the bundle generator script."""
     args = _parse_args()
-    generate_all_bundles(dry_run=args.dry_run, agent_filter=args.agent)
+    generate_all_bundles(dry_run=args.dry_run, agent_filter=args.agent, force=args.force)
 
 
 if __name__ == "__main__":
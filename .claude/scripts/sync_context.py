@@ -8,21 +8,27 @@ This script:
 4. Updates CLAUDE.md sections to reflect current state
 5. Optionally regenerates bundles
 """
-# ruff: noqa: C901, S404
+# ruff: noqa: C901
 
 from __future__ import annotations
 
 import argparse
-import copy
+import contextlib
+import functools
+import io
 import json
+import os
 import re
-import subprocess
 import sys
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
+import generate_bundles
 import validate_manifest
+import yaml
 
 # =============================================================================
 # Constants
@@ -48,19 +54,24 @@ COMMANDS_DIR = CLAUDE_DIR / "commands"
 BUNDLES_DIR = CLAUDE_DIR / "bundles"
 MANIFEST_PATH = CLAUDE_DIR / "manifest.json"
 CLAUDE_MD_PATH = CLAUDE_DIR / "CLAUDE.md"
-GENERATE_BUNDLES_SCRIPT = CLAUDE_DIR / "scripts" / "generate_bundles.py"
-PROJECT_ROOT = CLAUDE_DIR.parent
 
-_SKILL_CATEGORIES = ("conventions", "assessment", "templates", "utilities")
+# Opening delimiter, optional block, closing delimiter; the lazy optional group
+# lets an empty block ("---\n---") close on its own line
+_FRONTMATTER_PATTERN = re.compile(r"\A---\n(?:(.*?)\n)??---", re.DOTALL)
 
-_CATEGORY_DISPLAY_NAMES = {
-    "conventions": "Conventions",
-    "assessment": "Assessment",
-    "templates": "Templates",
-    "utilities": "Utilities",
-}
+# First line with visible text that is not a heading or list item
+_CONTENT_LINE_PATTERN = re.compile(r"^(?![#-]).*\S.*$", re.MULTILINE)
 
-_DEFAULT_MANIFEST = {
+# Skill categories in display order, paired with their headings
+_SKILL_CATEGORIES: Final = (
+    ("conventions", "Conventions"),
+    ("assessment", "Assessment"),
+    ("templates", "Templates"),
+    ("utilities", "Utilities"),
+)
+
+# Stored as JSON text so every fallback load parses a fresh, independent manifest
+_DEFAULT_MANIFEST_JSON: Final = json.dumps({
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "description": "Claude Code configuration manifest",
     "version": "1.1.0",
@@ -73,7 +84,7 @@ _DEFAULT_MANIFEST = {
         "templates": "Format specifications for agent outputs",
         "utilities": "Tools and scripts for common operations",
     },
-}
+})
 
 
 # =============================================================================
@@ -81,7 +92,7 @@ _DEFAULT_MANIFEST = {
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SkillInfo:
     """Metadata for a skill parsed from SKILL.md frontmatter.
 
@@ -100,7 +111,7 @@ class SkillInfo:
     category: str = "conventions"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentInfo:
     """Metadata for an agent parsed from frontmatter.
 
@@ -119,7 +130,7 @@ class AgentInfo:
     depends_on_skills: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommandInfo:
     """Metadata for a command parsed from frontmatter.
 
@@ -143,59 +154,33 @@ class CommandInfo:
 # =============================================================================
 
 
-def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
+def parse_frontmatter(content: str, source: str | Path = "markdown content") -> tuple[dict[str, Any], str]:
     """Parse YAML frontmatter from markdown content.
 
+    A single match of the precompiled frontmatter pattern locates the block,
+    which is handed to the YAML parser; the rest of the document is never
+    split or scanned. Malformed YAML is reported as a warning and treated as
+    empty frontmatter, so one bad file does not abort the whole sync.
+
     Args:
         content (str): Markdown content with optional YAML frontmatter.
+        source (str | Path): Where the content came from, named in warnings.
 
     Returns:
         tuple[dict[str, Any], str]: Tuple of (frontmatter dict, remaining content).
     """
-    if not content.startswith("---"):
-        return {}, content
-
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    match = _FRONTMATTER_PATTERN.match(content)
+    if match is None:
         return {}, content
 
-    frontmatter_text = parts[1].strip()
-    remaining = parts[2].strip()
-
-    frontmatter: dict[str, Any] = {}
-    current_key: str | None = None
-    current_list: list[str] = []
-
-    for raw_line in frontmatter_text.split("\n"):
-        stripped_line = raw_line.rstrip()
-        if not stripped_line:
-            continue
-
-        # Check for list item
-        if stripped_line.startswith("  - ") and current_key:
-            current_list.append(stripped_line[4:].strip().strip("\"'"))
-            continue
-
-        # Save previous list if any
-        if current_list and current_key:
-            frontmatter[current_key] = current_list
-            current_list = []
-
-        # Parse key: value
-        if ":" in stripped_line:
-            key, _, value = stripped_line.partition(":")
-            key = key.strip()
-            value = value.strip().strip("\"'")
-
-            if not value:
-                current_key = key
-            else:
-                frontmatter[key] = _parse_value(value)
-                current_key = key
-
-    # Save final list if any
-    if current_list and current_key:
-        frontmatter[current_key] = current_list
+    try:
+        frontmatter = generate_bundles.load_yaml(match.group(1) or "")
+    except yaml.YAMLError as e:
+        print(f"WARNING: Ignoring invalid YAML frontmatter in {source}: {e}", file=sys.stderr)
+        frontmatter = {}
+    if not isinstance(frontmatter, dict):
+        frontmatter = {}
+    remaining = content[match.end() :].strip()
 
     return frontmatter, remaining
 
@@ -213,29 +198,14 @@ def scan_skills() -> dict[str, SkillInfo]:
     """
     skills: dict[str, SkillInfo] = {}
 
-    if not SKILLS_DIR.exists():
-        return skills
-
-    for skill_dir in sorted(SKILLS_DIR.iterdir()):
-        if not skill_dir.is_dir():
-            continue
-
-        skill_file = skill_dir / "SKILL.md"
-        if not skill_file.exists():
+    for entry in _skill_entries(SKILLS_DIR):
+        result = _read_frontmatter_if_exists(Path(entry.path, "SKILL.md"))
+        if result is None:
             continue
 
-        content = skill_file.read_text()
-        frontmatter, _ = parse_frontmatter(content)
-
-        name = frontmatter.get("name", skill_dir.name)
-        description = frontmatter.get("description", "")
-
-        if not description:
-            lines = content.split("\n")
-            for content_line in lines:
-                if content_line and not content_line.startswith(("#", "-")):
-                    description = content_line.strip()
-                    break
+        frontmatter, body = result
+        name = frontmatter.get("name", entry.name)
+        description = frontmatter.get("description") or _first_content_line(body)
 
         skills[name] = SkillInfo(
             name=name,
@@ -255,14 +225,13 @@ def scan_agents() -> dict[str, AgentInfo]:
     """
     agents: dict[str, AgentInfo] = {}
 
-    if not AGENTS_DIR.exists():
-        return agents
-
-    for agent_file in sorted(AGENTS_DIR.glob("*.md")):
-        content = agent_file.read_text()
-        frontmatter, _ = parse_frontmatter(content)
+    for entry in _markdown_entries(AGENTS_DIR):
+        result = _read_frontmatter_if_exists(Path(entry.path))
+        if result is None:
+            continue
 
-        name = frontmatter.get("name", agent_file.stem)
+        frontmatter, _ = result
+        name = frontmatter.get("name", entry.name.removesuffix(".md"))
         agents[name] = AgentInfo(
             name=name,
             description=frontmatter.get("description", ""),
@@ -282,14 +251,13 @@ def scan_commands() -> dict[str, CommandInfo]:
     """
     commands: dict[str, CommandInfo] = {}
 
-    if not COMMANDS_DIR.exists():
-        return commands
-
-    for cmd_file in sorted(COMMANDS_DIR.glob("*.md")):
-        content = cmd_file.read_text()
-        frontmatter, _ = parse_frontmatter(content)
+    for entry in _markdown_entries(COMMANDS_DIR):
+        result = _read_frontmatter_if_exists(Path(entry.path))
+        if result is None:
+            continue
 
-        name = frontmatter.get("name", cmd_file.stem)
+        frontmatter, _ = result
+        name = frontmatter.get("name", entry.name.removesuffix(".md"))
         commands[name] = CommandInfo(
             name=name,
             description=frontmatter.get("description", ""),
@@ -312,9 +280,10 @@ def load_manifest() -> dict[str, Any]:
     Returns:
         dict[str, Any]: Manifest dict, or default structure if file doesn't exist.
     """
-    if MANIFEST_PATH.exists():
-        return json.loads(MANIFEST_PATH.read_text())
-    return copy.deepcopy(_DEFAULT_MANIFEST)
+    try:
+        return json.loads(MANIFEST_PATH.read_bytes())
+    except FileNotFoundError:
+        return json.loads(_DEFAULT_MANIFEST_JSON)
 
 
 def update_manifest(
@@ -367,7 +336,8 @@ def generate_claude_md_sections(
 ) -> dict[str, str]:
     """Generate updated sections for CLAUDE.md.
 
-    Uses manifest.json as the source of truth for descriptions.
+    Uses manifest.json as the source of truth for descriptions. Each mapping
+    is sorted once here and the ordered entries are shared by every section.
 
     Args:
         skills (dict[str, SkillInfo]): Discovered skills.
@@ -378,11 +348,12 @@ def generate_claude_md_sections(
     Returns:
         dict[str, str]: Dict mapping section name to content.
     """
+    sorted_agents = sorted(agents.items())
     return {
-        "Commands": _generate_commands_section(commands, manifest),
-        "Agents": _generate_agents_section(agents, manifest),
-        "Context Bundles": _generate_bundles_section(agents),
-        "Skills": _generate_skills_section(skills, manifest),
+        "Commands": _generate_commands_section(sorted(commands.items()), manifest),
+        "Agents": _generate_agents_section(sorted_agents, manifest),
+        "Context Bundles": _generate_bundles_section(sorted_agents),
+        "Skills": _generate_skills_section(sorted(skills.items()), manifest),
     }
 
 
@@ -398,25 +369,26 @@ def update_claude_md(sections: dict[str, str], *, dry_run: bool = False) -> list
     """
     changes: list[str] = []
 
-    if not CLAUDE_MD_PATH.exists():
+    try:
+        content = generate_bundles.read_text(CLAUDE_MD_PATH)
+    except FileNotFoundError:
         changes.append("CLAUDE.md does not exist")
         return changes
 
-    content = CLAUDE_MD_PATH.read_text()
-
-    for section_name, new_content in sections.items():
-        # Match section content up to: subsection (###), separator (---), next section (##), or end
-        pattern = rf"(## {re.escape(section_name)}\n\n)(.*?)(\n\n###|\n\n---|\n\n## |\Z)"
-        match = re.search(pattern, content, re.DOTALL)
+    # Locate every section in one scan, keeping the first occurrence of each name
+    matches: dict[str, re.Match[str]] = {}
+    for match in _sections_pattern(tuple(sections)).finditer(content):
+        matches.setdefault(match.group("name"), match)
 
-        if match:
-            old_content = match.group(2).strip()
-            if old_content != new_content.strip():
-                content = content[: match.start(2)] + new_content + "\n" + content[match.end(2) :]
-                changes.append(f"Updated CLAUDE.md section: {section_name}")
+    replacements = {
+        name: new_content
+        for name, new_content in sections.items()
+        if name in matches and matches[name].group("body").strip() != new_content.strip()
+    }
+    changes.extend(f"Updated CLAUDE.md section: {name}" for name in replacements)
 
     if changes and not dry_run:
-        CLAUDE_MD_PATH.write_text(content)
+        CLAUDE_MD_PATH.write_bytes(_splice_sections(content, matches, replacements).encode("utf-8"))
 
     return changes
 
@@ -427,7 +399,10 @@ def update_claude_md(sections: dict[str, str], *, dry_run: bool = False) -> list
 
 
 def regenerate_bundles(*, dry_run: bool = False) -> list[str]:
-    """Run the generate_bundles.py script.
+    """Regenerate agent bundles in-process with generate_bundles.
+
+    The generator's progress output is captured rather than echoed, matching
+    the summary-only reporting of the rest of the sync.
 
     Args:
         dry_run (bool): If True, don't actually regenerate.
@@ -435,26 +410,36 @@ def regenerate_bundles(*, dry_run: bool = False) -> list[str]:
     Returns:
         list[str]: List of changes/output.
     """
-    if not GENERATE_BUNDLES_SCRIPT.exists():
-        return ["generate_bundles.py not found"]
-
     if dry_run:
         return ["Would regenerate bundles"]
 
-    result = subprocess.run(  # noqa: S603
-        ["uv", "run", "python", str(GENERATE_BUNDLES_SCRIPT)],  # noqa: S607
-        capture_output=True,
-        text=True,
-        cwd=PROJECT_ROOT,
-        check=False,
-    )
-
-    if result.returncode != 0:
-        return [f"Bundle generation failed: {result.stderr}"]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_bundles.generate_all_bundles()
+    except Exception as e:  # noqa: BLE001 # top-level boundary: report any failure instead of aborting the sync
+        return [f"Bundle generation failed: {e}"]
 
     return ["Regenerated bundles"]
 
 
+def check_bundles(manifest: dict[str, Any]) -> list[str]:
+    """Report agents whose bundles are missing or out of date.
+
+    Bundles are compared with a fresh in-memory rendering, so only real
+    content changes are reported. Generator warnings are captured like in
+    regenerate_bundles.
+
+    Args:
+        manifest (dict[str, Any]): The manifest dict listing the agents.
+
+    Returns:
+        list[str]: One change per agent with stale bundles, in manifest order.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        stale_agents = generate_bundles.find_stale_agents(manifest)
+    return [f"Bundles out of date: {agent_name}" for agent_name in stale_agents]
+
+
 # =============================================================================
 # Public Interface - Entry Point
 # =============================================================================
@@ -473,6 +458,9 @@ def main() -> int:
     parser.add_argument("--check", action="store_true", help="Exit with error code if files need updating")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed output")
     parser.add_argument("--skip-bundles", action="store_true", help="Skip bundle regeneration")
+    parser.add_argument(
+        "--check-bundles", action="store_true", help="With --check, also report agents whose bundles are out of date"
+    )
     args = parser.parse_args()
 
     all_changes: list[str] = []
@@ -494,17 +482,20 @@ def main() -> int:
     all_changes.extend(manifest_changes)
 
     if manifest_changes and not args.dry_run and not args.check:
-        MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + "\n")
+        MANIFEST_PATH.write_bytes((json.dumps(manifest, indent=2) + "\n").encode("utf-8"))
 
-    print("Updating CLAUDE.md...")
-    sections = generate_claude_md_sections(skills, agents, commands, manifest)
-    claude_md_changes = update_claude_md(sections, dry_run=args.dry_run or args.check)
-    all_changes.extend(claude_md_changes)
+    # In check mode the answer is binary, so stop at the first stage that reports changes
+    stop_early = args.check and bool(all_changes)
 
-    if not args.skip_bundles:
-        print("Regenerating bundles...")
-        bundle_changes = regenerate_bundles(dry_run=args.dry_run or args.check)
-        all_changes.extend(bundle_changes)
+    if not stop_early:
+        print("Updating CLAUDE.md...")
+        sections = generate_claude_md_sections(skills, agents, commands, manifest)
+        claude_md_changes = update_claude_md(sections, dry_run=args.dry_run or args.check)
+        all_changes.extend(claude_md_changes)
+        stop_early = args.check and bool(all_changes)
+
+    if not (args.skip_bundles or stop_early or (args.check and not args.check_bundles)):
+        all_changes.extend(_bundle_changes(manifest, check=args.check, dry_run=args.dry_run))
 
     if all_changes:
         print("\nChanges:")
@@ -531,28 +522,131 @@ def main() -> int:
     return 0
 
 
+# =============================================================================
+# Private Helpers - Bundles
+# =============================================================================
+
+
+def _bundle_changes(manifest: dict[str, Any], *, check: bool, dry_run: bool) -> list[str]:
+    """Run the bundle stage of the sync, reporting stale bundles in check mode.
+
+    Args:
+        manifest (dict[str, Any]): The synced manifest dict.
+        check (bool): If True, only report agents whose bundles are out of date.
+        dry_run (bool): If True, don't actually regenerate.
+
+    Returns:
+        list[str]: List of changes/output.
+    """
+    if check:
+        print("Checking bundles...")
+        return check_bundles(manifest)
+    print("Regenerating bundles...")
+    return regenerate_bundles(dry_run=dry_run)
+
+
+# =============================================================================
+# Private Helpers - Scanning
+# =============================================================================
+
+
+def _scan_entries(directory: Path, keep: Callable[[os.DirEntry[str]], bool]) -> list[os.DirEntry[str]]:
+    """List the wanted entries of a directory in one pass, sorted by name.
+
+    ``os.scandir`` entries carry the file type from the directory read, so
+    ``keep`` can test ``is_dir``/``is_file`` without extra stat calls. Only the
+    kept entries are sorted.
+
+    Args:
+        directory (Path): Directory to list.
+        keep (Callable[[os.DirEntry[str]], bool]): Predicate selecting the entries to return.
+
+    Returns:
+        list[os.DirEntry[str]]: Kept entries sorted by name, or an empty list if the
+            directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            kept = [entry for entry in entries if keep(entry)]
+    except FileNotFoundError:
+        return []
+    kept.sort(key=lambda entry: entry.name)
+    return kept
+
+
+def _skill_entries(directory: Path) -> list[os.DirEntry[str]]:
+    """List the skill subdirectories of a directory, sorted by name.
+
+    Args:
+        directory (Path): Directory to list.
+
+    Returns:
+        list[os.DirEntry[str]]: Entries for subdirectories.
+    """
+    return _scan_entries(directory, lambda entry: entry.is_dir())
+
+
+def _markdown_entries(directory: Path) -> list[os.DirEntry[str]]:
+    """List the markdown files in a directory, sorted by name.
+
+    The cheap name check runs before ``is_file``, so non-markdown entries
+    never need their type resolved.
+
+    Args:
+        directory (Path): Directory to list.
+
+    Returns:
+        list[os.DirEntry[str]]: Entries for ``*.md`` files.
+    """
+    return _scan_entries(directory, lambda entry: entry.name.endswith(".md") and entry.is_file())
+
+
+def _read_frontmatter_if_exists(path: Path) -> tuple[dict[str, Any], str] | None:
+    """Read and parse a markdown file, tolerating its absence.
+
+    Args:
+        path (Path): Markdown file to read.
+
+    Returns:
+        tuple[dict[str, Any], str] | None: Parsed (frontmatter, content), or None if missing.
+    """
+    try:
+        return _read_frontmatter(path)
+    except FileNotFoundError:
+        return None
+
+
+def _read_frontmatter(path: Path) -> tuple[dict[str, Any], str]:
+    """Read and parse a markdown file.
+
+    Args:
+        path (Path): Markdown file to read.
+
+    Returns:
+        tuple[dict[str, Any], str]: Tuple of (frontmatter dict, remaining content).
+    """
+    return parse_frontmatter(generate_bundles.read_text(path), path)
+
+
 # =============================================================================
 # Private Helpers - Parsing
 # =============================================================================
 
 
-def _parse_value(value: str) -> str | bool | list[str]:
-    """Parse a frontmatter value string into appropriate type.
+def _first_content_line(body: str) -> str:
+    """Find the first line of markdown body text that is not a heading or list item.
+
+    Blank and whitespace-only lines (including the bare carriage returns left
+    by CRLF line endings) are skipped.
 
     Args:
-        value (str): The value string to parse.
+        body (str): Markdown content with frontmatter already removed.
 
     Returns:
-        str | bool | list[str]: Parsed value as bool, list, or string.
+        str: The stripped line, or an empty string if none qualifies.
     """
-    if value.lower() == "true":
-        return True
-    if value.lower() == "false":
-        return False
-    if value.startswith("[") and value.endswith("]"):
-        items = value[1:-1].split(",")
-        return [item.strip().strip("\"'") for item in items if item.strip()]
-    return value
+    match = _CONTENT_LINE_PATTERN.search(body)
+    return match.group().strip() if match else ""
 
 
 # =============================================================================
@@ -573,28 +667,7 @@ def _sync_skills(
     Returns:
         tuple[list[dict[str, Any]], list[str]]: Tuple of (new skills list, changes list).
     """
-    changes: list[str] = []
-    existing = {s["name"]: s for s in manifest.get("skills", [])}
-
-    new_skills = []
-    for name, info in skills.items():
-        if name in existing:
-            new_skills.append(existing[name])
-        else:
-            new_skills.append({
-                "name": info.name,
-                "category": info.category,
-                "description": info.description,
-                "user_invocable": info.user_invocable,
-                "version": info.version,
-            })
-            changes.append(f"Added skill: {name}")
-
-    for name in existing:
-        if name not in skills:
-            changes.append(f"Removed skill: {name}")
-
-    return new_skills, changes
+    return _sync_entries(manifest.get("skills", []), skills, "skill", _skill_entry)
 
 
 def _sync_agents(
@@ -610,28 +683,7 @@ def _sync_agents(
     Returns:
         tuple[list[dict[str, Any]], list[str]]: Tuple of (new agents list, changes list).
     """
-    changes: list[str] = []
-    existing = {a["name"]: a for a in manifest.get("agents", [])}
-
-    new_agents = []
-    for name, info in agents.items():
-        if name in existing:
-            new_agents.append(existing[name])
-        else:
-            new_agents.append({
-                "name": info.name,
-                "description": info.description,
-                "model": info.model,
-                "version": info.version,
-                "depends_on_skills": info.depends_on_skills,
-            })
-            changes.append(f"Added agent: {name}")
-
-    for name in existing:
-        if name not in agents:
-            changes.append(f"Removed agent: {name}")
-
-    return new_agents, changes
+    return _sync_entries(manifest.get("agents", []), agents, "agent", _agent_entry)
 
 
 def _sync_commands(
@@ -647,31 +699,97 @@ def _sync_commands(
     Returns:
         tuple[list[dict[str, Any]], list[str]]: Tuple of (new commands list, changes list).
     """
-    changes: list[str] = []
-    existing = {c["name"]: c for c in manifest.get("commands", [])}
-
-    new_commands = []
-    for name, info in commands.items():
-        if name in existing:
-            new_commands.append(existing[name])
-        else:
-            entry: dict[str, Any] = {
-                "name": info.name,
-                "description": info.description,
-                "version": info.version,
-            }
-            if info.depends_on_agents:
-                entry["depends_on_agents"] = info.depends_on_agents
-            if info.depends_on_skills:
-                entry["depends_on_skills"] = info.depends_on_skills
-            new_commands.append(entry)
-            changes.append(f"Added command: {name}")
-
-    for name in existing:
-        if name not in commands:
-            changes.append(f"Removed command: {name}")
-
-    return new_commands, changes
+    return _sync_entries(manifest.get("commands", []), commands, "command", _command_entry)
+
+
+def _sync_entries[T](
+    manifest_entries: list[dict[str, Any]],
+    discovered: dict[str, T],
+    kind: str,
+    to_entry: Callable[[T], dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Sync one manifest list with the items discovered on disk.
+
+    Existing manifest entries are kept as-is (they are the source of truth for
+    descriptions); new items are converted with ``to_entry``. The common case of
+    no additions or removals is detected with a single key-set comparison.
+
+    Args:
+        manifest_entries (list[dict[str, Any]]): Current manifest entries of this kind.
+        discovered (dict[str, T]): Discovered items from disk, keyed by name.
+        kind (str): Item kind used in change messages (e.g., "skill").
+        to_entry (Callable[[T], dict[str, Any]]): Builds a manifest entry for a new item.
+
+    Returns:
+        tuple[list[dict[str, Any]], list[str]]: Tuple of (new entries list, changes list).
+    """
+    existing = {entry["name"]: entry for entry in manifest_entries}
+    if existing.keys() == discovered.keys():
+        return [existing[name] for name in discovered], []
+
+    new_entries = [existing[name] if name in existing else to_entry(info) for name, info in discovered.items()]
+    changes = [f"Added {kind}: {name}" for name in discovered if name not in existing]
+    changes.extend(f"Removed {kind}: {name}" for name in existing if name not in discovered)
+    return new_entries, changes
+
+
+def _skill_entry(info: SkillInfo) -> dict[str, Any]:
+    """Build the manifest entry for a newly discovered skill.
+
+    Args:
+        info (SkillInfo): Discovered skill.
+
+    Returns:
+        dict[str, Any]: Manifest entry.
+    """
+    return {
+        "name": info.name,
+        "category": info.category,
+        "description": info.description,
+        "user_invocable": info.user_invocable,
+        "version": info.version,
+    }
+
+
+def _agent_entry(info: AgentInfo) -> dict[str, Any]:
+    """Build the manifest entry for a newly discovered agent.
+
+    Args:
+        info (AgentInfo): Discovered agent.
+
+    Returns:
+        dict[str, Any]: Manifest entry.
+    """
+    return {
+        "name": info.name,
+        "description": info.description,
+        "model": info.model,
+        "version": info.version,
+        "depends_on_skills": info.depends_on_skills,
+    }
+
+
+def _command_entry(info: CommandInfo) -> dict[str, Any]:
+    """Build the manifest entry for a newly discovered command.
+
+    Dependency lists are only included when non-empty.
+
+    Args:
+        info (CommandInfo): Discovered command.
+
+    Returns:
+        dict[str, Any]: Manifest entry.
+    """
+    entry: dict[str, Any] = {
+        "name": info.name,
+        "description": info.description,
+        "version": info.version,
+    }
+    if info.depends_on_agents:
+        entry["depends_on_agents"] = info.depends_on_agents
+    if info.depends_on_skills:
+        entry["depends_on_skills"] = info.depends_on_skills
+    return entry
 
 
 # =============================================================================
@@ -680,13 +798,13 @@ def _sync_commands(
 
 
 def _generate_commands_section(
-    commands: dict[str, CommandInfo],
+    commands: Sequence[tuple[str, CommandInfo]],
     manifest: dict[str, Any],
 ) -> str:
     """Generate the Commands section content.
 
     Args:
-        commands (dict[str, CommandInfo]): Discovered commands.
+        commands (Sequence[tuple[str, CommandInfo]]): Discovered commands, sorted by name.
         manifest (dict[str, Any]): Current manifest for descriptions.
 
     Returns:
@@ -699,20 +817,20 @@ def _generate_commands_section(
         "| Command | Purpose |",
         "|---------|---------|",
     ]
-    for name in sorted(commands.keys()):
-        desc = manifest_commands.get(name, {}).get("description", commands[name].description)
+    for name, info in commands:
+        desc = manifest_commands.get(name, {}).get("description", info.description)
         lines.append(f"| `/{name}` | {desc} |")
     return "\n".join(lines)
 
 
 def _generate_agents_section(
-    agents: dict[str, AgentInfo],
+    agents: Sequence[tuple[str, AgentInfo]],
     manifest: dict[str, Any],
 ) -> str:
     """Generate the Agents section content.
 
     Args:
-        agents (dict[str, AgentInfo]): Discovered agents.
+        agents (Sequence[tuple[str, AgentInfo]]): Discovered agents, sorted by name.
         manifest (dict[str, Any]): Current manifest for descriptions.
 
     Returns:
@@ -725,17 +843,17 @@ def _generate_agents_section(
         "| Agent | Scope |",
         "|-------|-------|",
     ]
-    for name, info in sorted(agents.items()):
+    for name, info in agents:
         desc = manifest_agents.get(name, {}).get("description", info.description)
         lines.append(f"| `{name}` | {desc} |")
     return "\n".join(lines)
 
 
-def _generate_bundles_section(agents: dict[str, AgentInfo]) -> str:
+def _generate_bundles_section(agents: Sequence[tuple[str, AgentInfo]]) -> str:
     """Generate the Context Bundles section content.
 
     Args:
-        agents (dict[str, AgentInfo]): Discovered agents.
+        agents (Sequence[tuple[str, AgentInfo]]): Discovered agents, sorted by name.
 
     Returns:
         str: Formatted markdown section content.
@@ -746,7 +864,7 @@ def _generate_bundles_section(agents: dict[str, AgentInfo]) -> str:
         "| Agent | Full Bundle | Compact Bundle |",
         "|-------|-------------|----------------|",
     ]
-    for name in sorted(agents.keys()):
+    for name, _ in agents:
         lines.append(f"| `{name}` | `bundles/{name}.md` | `bundles/{name}-compact.md` |")
     lines.extend([
         "",
@@ -759,26 +877,24 @@ def _generate_bundles_section(agents: dict[str, AgentInfo]) -> str:
 
 
 def _generate_skills_section(
-    skills: dict[str, SkillInfo],
+    skills: Sequence[tuple[str, SkillInfo]],
     manifest: dict[str, Any],
 ) -> str:
     """Generate the Skills section content.
 
     Args:
-        skills (dict[str, SkillInfo]): Discovered skills.
+        skills (Sequence[tuple[str, SkillInfo]]): Discovered skills, sorted by name.
         manifest (dict[str, Any]): Current manifest for category info.
 
     Returns:
         str: Formatted markdown section content.
     """
-    categories: dict[str, list[str]] = {cat: [] for cat in _SKILL_CATEGORIES}
-
     skill_categories = {s["name"]: s.get("category", "conventions") for s in manifest.get("skills", [])}
 
-    for name in sorted(skills.keys()):
-        cat = skill_categories.get(name, "conventions")
-        if cat in categories:
-            categories[cat].append(f"`{name}`")
+    # Unknown categories collect here too but are never rendered
+    categories: defaultdict[str, list[str]] = defaultdict(list)
+    for name, _ in skills:
+        categories[skill_categories.get(name, "conventions")].append(f"`{name}`")
 
     lines = [
         "Skills provide coding standards and conventions. See `.claude/manifest.json` for the complete catalog.",
@@ -786,8 +902,8 @@ def _generate_skills_section(
         "**Categories**:",
     ]
 
-    for cat_key, cat_name in _CATEGORY_DISPLAY_NAMES.items():
-        if categories[cat_key]:
+    for cat_key, cat_name in _SKILL_CATEGORIES:
+        if cat_key in categories:
             lines.append(f"- **{cat_name}**: {', '.join(categories[cat_key])}")
 
     lines.extend([
@@ -797,5 +913,47 @@ def _generate_skills_section(
     return "\n".join(lines)
 
 
+# =============================================================================
+# Private Helpers - CLAUDE.md
+# =============================================================================
+
+
+@functools.cache
+def _sections_pattern(section_names: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile (once per set of names) the pattern that locates CLAUDE.md sections.
+
+    The pattern matches section content up to, but not including: subsection
+    (###), separator (---), next section (##), or end of file.
+
+    Args:
+        section_names (tuple[str, ...]): Heading texts of the sections.
+
+    Returns:
+        re.Pattern[str]: Compiled pattern with ``name`` and ``body`` groups.
+    """
+    names = "|".join(re.escape(name) for name in section_names)
+    return re.compile(rf"## (?P<name>{names})\n\n(?P<body>.*?)(?=\n\n###|\n\n---|\n\n## |\Z)", re.DOTALL)
+
+
+def _splice_sections(content: str, matches: dict[str, re.Match[str]], replacements: dict[str, str]) -> str:
+    """Build the updated CLAUDE.md text in a single pass over the original.
+
+    Args:
+        content (str): Original CLAUDE.md content.
+        matches (dict[str, re.Match[str]]): Section name to its match in ``content``.
+        replacements (dict[str, str]): Section name to new body, for sections that changed.
+
+    Returns:
+        str: Content with each replaced section body swapped for its new text.
+    """
+    parts: list[str] = []
+    position = 0
+    for match in sorted((matches[name] for name in replacements), key=lambda m: m.start()):
+        parts.extend((content[position : match.start("body")], replacements[match.group("name")], "\n"))
+        position = match.end("body")
+    parts.append(content[position:])
+    return "".join(parts)
+
+
 if __name__ == "__main__":
     sys.exit(main())
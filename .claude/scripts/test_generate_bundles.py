@@ -9,7 +9,10 @@ frontmatter parsing, layer loading, bundle generation, and CLI argument parsing.
 
 from __future__ import annotations
 
+import io
 import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -24,20 +27,21 @@ from pytest_check import check
 # ============================================================================
 
 
-@pytest.fixture
-def skills_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def skills_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Provide a temporary skills directory with sample skill files.
 
     Creates a skills directory with two skills: one with layers (has
     frontmatter referencing rules.md and examples.md) and one without.
+    The scaffold is built once per module; tests must treat it as read-only.
 
     Args:
-        tmp_path (Path): Pytest temporary directory fixture.
+        tmp_path_factory (pytest.TempPathFactory): Pytest session temporary directory factory.
 
     Returns:
         Path: Path to the temporary skills directory.
     """
-    skills = tmp_path / "skills"
+    skills = tmp_path_factory.mktemp("scaffold") / "skills"
     skills.mkdir()
 
     # Skill with layers
@@ -69,7 +73,7 @@ def skills_dir(tmp_path: Path) -> Path:
     return skills
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def manifest_data() -> dict[str, Any]:
     """Provide a minimal valid manifest for testing.
 
@@ -112,20 +116,20 @@ def manifest_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
-def manifest_file(tmp_path: Path, manifest_data: dict[str, Any]) -> Path:
-    """Create a temporary manifest.json file.
+@pytest.fixture(scope="module")
+def manifest_file(tmp_path_factory: pytest.TempPathFactory, manifest_data: dict[str, Any]) -> Path:
+    """Create a temporary manifest.json file, once per module.
 
     Args:
-        tmp_path (Path): Pytest temporary directory fixture.
+        tmp_path_factory (pytest.TempPathFactory): Pytest session temporary directory factory.
         manifest_data (dict[str, Any]): The manifest data fixture.
 
     Returns:
         Path: Path to the temporary manifest file.
     """
-    skills_dir = tmp_path / "skills"
-    skills_dir.mkdir(exist_ok=True)
-    manifest_path = tmp_path / "manifest.json"
+    manifest_dir = tmp_path_factory.mktemp("manifest")
+    (manifest_dir / "skills").mkdir(exist_ok=True)
+    manifest_path = manifest_dir / "manifest.json"
     manifest_path.write_text(json.dumps(manifest_data, indent=2))
     return manifest_path
 
@@ -145,6 +149,45 @@ def bundles_dir(tmp_path: Path) -> Path:
     return bundles
 
 
+@pytest.fixture(autouse=True)
+def _clear_skill_cache() -> Iterator[None]:
+    """Empty the process-wide skill cache around every test.
+
+    Yields:
+        None: Control to the test, with an empty cache on entry and exit.
+    """
+    generate_bundles._load_skill_dir.cache_clear()
+    yield
+    generate_bundles._load_skill_dir.cache_clear()
+
+
+@pytest.fixture
+def patched_skills_dir(skills_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the module's SKILLS_DIR at the shared skills scaffold.
+
+    Args:
+        skills_dir (Path): Temporary skills directory fixture.
+        monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+    """
+    monkeypatch.setattr(generate_bundles, "SKILLS_DIR", skills_dir)
+
+
+@pytest.fixture
+def patched_paths(skills_dir: Path, bundles_dir: Path, manifest_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the module's skills, bundles, manifest, and .claude paths at the temporary fixtures.
+
+    Args:
+        skills_dir (Path): Temporary skills directory fixture.
+        bundles_dir (Path): Temporary bundles directory fixture.
+        manifest_file (Path): Temporary manifest file fixture.
+        monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+    """
+    monkeypatch.setattr(generate_bundles, "SKILLS_DIR", skills_dir)
+    monkeypatch.setattr(generate_bundles, "BUNDLES_DIR", bundles_dir)
+    monkeypatch.setattr(generate_bundles, "MANIFEST_PATH", manifest_file)
+    monkeypatch.setattr(generate_bundles, "CLAUDE_DIR", bundles_dir.parent)
+
+
 # ============================================================================
 # Test: load_manifest
 # ============================================================================
@@ -230,22 +273,61 @@ class TestSkillContent:
         # Assert
         assert has_layers is True
 
+    def test_ordered_layers_priority_order_and_cached(self) -> None:
+        """Ordered layers should follow priority ordering and be computed only once."""
+        # Arrange
+        skill = generate_bundles.SkillContent(
+            main_content="content",
+            layers={"zeta": "Z", "examples": "E", "rules": "R"},
+        )
+
+        # Act
+        first = skill.ordered_layers
+        second = skill.ordered_layers
+
+        # Assert
+        with check:
+            assert first == [("rules", "R"), ("examples", "E"), ("zeta", "Z")]
+        with check:
+            assert first is second
+
+    def test_quick_reference_repeated_access_extracts_once(self) -> None:
+        """Quick Reference should be extracted on first access and reused afterwards."""
+        # Arrange
+        skill = generate_bundles.SkillContent(
+            main_content="# Skill\n\n## Quick Reference\n\n| A | B |\n\n## Details\n\nMore.\n",
+            layers={},
+        )
+
+        # Act
+        with patch.object(
+            generate_bundles, "extract_quick_reference", wraps=generate_bundles.extract_quick_reference
+        ) as extract:
+            first = skill.quick_reference
+            second = skill.quick_reference
+
+        # Assert
+        with check:
+            assert first == second == "## Quick Reference\n\n| A | B |"
+        with check:
+            assert extract.call_count == 1
+
 
 # ============================================================================
-# Test: _parse_frontmatter
+# Test: _split_frontmatter
 # ============================================================================
 
 
-class TestParseFrontmatter:
-    """Tests for YAML frontmatter parsing."""
+class TestSplitFrontmatter:
+    """Tests for splitting YAML frontmatter from markdown content."""
 
-    def test_parse_frontmatter_with_valid_frontmatter_returns_dict(self) -> None:
+    def test_split_frontmatter_with_valid_frontmatter_returns_dict(self) -> None:
         """Content with valid YAML frontmatter should return parsed dict."""
         # Arrange
         content = "---\nlayers:\n  rules: rules.md\n  examples: examples.md\n---\n# Title\n"
 
         # Act
-        frontmatter = generate_bundles._parse_frontmatter(content)
+        frontmatter, _ = generate_bundles._split_frontmatter(content)
 
         # Assert
         with check:
@@ -255,86 +337,78 @@ class TestParseFrontmatter:
         with check:
             assert frontmatter["layers"]["examples"] == "examples.md"
 
-    def test_parse_frontmatter_without_frontmatter_returns_empty_dict(self) -> None:
-        """Content without frontmatter should return empty dict."""
+    def test_split_frontmatter_python_tags_are_rejected(self) -> None:
+        """Frontmatter should be parsed with a safe loader that refuses Python object tags."""
+        # Arrange
+        content = "---\nhook: !!python/name:os.system\n---\n# Title\n"
+
+        # Act / Assert
+        with pytest.raises(yaml.constructor.ConstructorError):
+            generate_bundles._split_frontmatter(content)
+
+    def test_split_frontmatter_without_frontmatter_returns_empty_dict(self) -> None:
+        """Content without frontmatter should return empty dict and unchanged content."""
         # Arrange
         content = "# Title\n\nSome content.\n"
 
         # Act
-        frontmatter = generate_bundles._parse_frontmatter(content)
+        frontmatter, body = generate_bundles._split_frontmatter(content)
 
         # Assert
-        assert frontmatter == {}
+        with check:
+            assert frontmatter == {}
+        with check:
+            assert body == content
 
-    def test_parse_frontmatter_with_empty_frontmatter_returns_empty_dict(self) -> None:
+    def test_split_frontmatter_with_empty_frontmatter_returns_empty_dict(self) -> None:
         """Content with empty frontmatter block should return empty dict."""
         # Arrange
         content = "---\n\n---\n# Title\n"
 
         # Act
-        frontmatter = generate_bundles._parse_frontmatter(content)
+        frontmatter, _ = generate_bundles._split_frontmatter(content)
 
         # Assert
         assert frontmatter == {}
 
-    def test_parse_frontmatter_malformed_yaml_raises_error(self) -> None:
+    def test_split_frontmatter_malformed_yaml_raises_error(self) -> None:
         """Malformed YAML in frontmatter should raise yaml.YAMLError."""
         # Arrange - unclosed bracket is invalid YAML
         content = "---\n[unclosed bracket\n---\n# Title\n"
 
         # Act / Assert
         with pytest.raises(yaml.YAMLError):
-            generate_bundles._parse_frontmatter(content)
-
-
-# ============================================================================
-# Test: _remove_frontmatter
-# ============================================================================
+            generate_bundles._split_frontmatter(content)
 
-
-class TestRemoveFrontmatter:
-    """Tests for frontmatter removal from markdown content."""
-
-    def test_remove_frontmatter_with_frontmatter_strips_it(self) -> None:
-        """Content with frontmatter should have frontmatter block removed."""
+    def test_split_frontmatter_with_frontmatter_strips_it_from_body(self) -> None:
+        """Content with frontmatter should have frontmatter block removed from the body."""
         # Arrange
         content = "---\nlayers:\n  rules: rules.md\n---\n# Title\n\nBody.\n"
 
         # Act
-        cleaned = generate_bundles._remove_frontmatter(content)
+        _, body = generate_bundles._split_frontmatter(content)
 
         # Assert
         with check:
-            assert "---" not in cleaned
+            assert "---" not in body
         with check:
-            assert cleaned.startswith("# Title")
-
-    def test_remove_frontmatter_without_frontmatter_returns_unchanged(self) -> None:
-        """Content without frontmatter should be returned unchanged."""
-        # Arrange
-        content = "# Title\n\nBody content.\n"
-
-        # Act
-        cleaned = generate_bundles._remove_frontmatter(content)
-
-        # Assert
-        assert cleaned == content
+            assert body.startswith("# Title")
 
-    def test_remove_frontmatter_preserves_horizontal_rules_in_body(self) -> None:
+    def test_split_frontmatter_preserves_horizontal_rules_in_body(self) -> None:
         """Horizontal rules (---) in body content should be preserved after frontmatter removal."""
         # Arrange
         content = "---\nlayers:\n  rules: rules.md\n---\n# Title\n\n---\n\nBody after rule.\n"
 
         # Act
-        cleaned = generate_bundles._remove_frontmatter(content)
+        _, body = generate_bundles._split_frontmatter(content)
 
         # Assert
         with check:
-            assert cleaned.startswith("# Title")
+            assert body.startswith("# Title")
         with check:
-            assert "---" in cleaned
+            assert "---" in body
         with check:
-            assert "Body after rule." in cleaned
+            assert "Body after rule." in body
 
 
 # ============================================================================
@@ -405,24 +479,54 @@ class TestLoadLayerFiles:
         with check:
             assert "examples" not in layers
 
+    def test_load_layer_files_many_layers_keeps_config_order(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Layers should come back in config order, skipping missing files.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+            capsys (pytest.CaptureFixture[str]): Pytest stdout/stderr capture fixture.
+        """
+        # Arrange
+        skill_dir = tmp_path / "my-skill"
+        skill_dir.mkdir()
+        for name in ("rules", "examples", "extra"):
+            (skill_dir / f"{name}.md").write_text(f"{name} content\n")
+        layers_config = {
+            "rules": "rules.md",
+            "examples": "examples.md",
+            "missing": "missing.md",
+            "extra": "extra.md",
+        }
+
+        # Act
+        layers = generate_bundles._load_layer_files(skill_dir, layers_config)
+
+        # Assert
+        with check:
+            assert list(layers.items()) == [
+                ("rules", "rules content"),
+                ("examples", "examples content"),
+                ("extra", "extra content"),
+            ]
+        with check:
+            assert "Layer file not found" in capsys.readouterr().out
+
 
 # ============================================================================
 # Test: load_skill_content
 # ============================================================================
 
 
+@pytest.mark.usefixtures("patched_skills_dir")
 class TestLoadSkillContent:
     """Tests for loading complete skill content including layers."""
 
-    def test_load_skill_content_with_layers_returns_skill(self, skills_dir: Path) -> None:
-        """Skill with frontmatter layers should load main content and layers.
-
-        Args:
-            skills_dir (Path): Temporary skills directory fixture.
-        """
+    def test_load_skill_content_with_layers_returns_skill(self) -> None:
+        """Skill with frontmatter layers should load main content and layers."""
         # Act
-        with patch.object(generate_bundles, "SKILLS_DIR", skills_dir):
-            skill = generate_bundles.load_skill_content("test-skill")
+        skill = generate_bundles.load_skill_content("test-skill")
 
         # Assert
         assert skill is not None
@@ -435,15 +539,10 @@ class TestLoadSkillContent:
         with check:
             assert "Example A" in skill.layers["examples"]
 
-    def test_load_skill_content_without_layers_returns_skill(self, skills_dir: Path) -> None:
-        """Skill without frontmatter layers should load with empty layers dict.
-
-        Args:
-            skills_dir (Path): Temporary skills directory fixture.
-        """
+    def test_load_skill_content_without_layers_returns_skill(self) -> None:
+        """Skill without frontmatter layers should load with empty layers dict."""
         # Act
-        with patch.object(generate_bundles, "SKILLS_DIR", skills_dir):
-            skill = generate_bundles.load_skill_content("simple-skill")
+        skill = generate_bundles.load_skill_content("simple-skill")
 
         # Assert
         assert skill is not None
@@ -454,18 +553,51 @@ class TestLoadSkillContent:
         with check:
             assert skill.layers == {}
 
-    def test_load_skill_content_missing_skill_returns_none(self, skills_dir: Path) -> None:
-        """Non-existent skill should return None.
+    def test_load_skill_content_missing_skill_returns_none(self) -> None:
+        """Non-existent skill should return None."""
+        # Act
+        skill = generate_bundles.load_skill_content("nonexistent-skill")
+
+        # Assert
+        assert skill is None
+
+    def test_load_skill_content_crlf_line_endings_parses_frontmatter(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A SKILL.md saved with CRLF line endings should still have its frontmatter and layers parsed.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
+            tmp_path (Path): Pytest temporary directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
         """
+        # Arrange - written as bytes so the CRLF line endings reach the parser untranslated
+        skill_dir = tmp_path / "crlf-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_bytes(
+            b"---\r\nname: crlf-skill\r\nlayers:\r\n  rules: rules.md\r\n---\r\n\r\n# CRLF Skill\r\n\r\nBody.\r\n"
+        )
+        (skill_dir / "rules.md").write_bytes(b"Rule 1.\r\nRule 2.\r\n")
+        monkeypatch.setattr(generate_bundles, "SKILLS_DIR", tmp_path)
+
         # Act
-        with patch.object(generate_bundles, "SKILLS_DIR", skills_dir):
-            skill = generate_bundles.load_skill_content("nonexistent-skill")
+        skill = generate_bundles.load_skill_content("crlf-skill")
 
         # Assert
-        assert skill is None
+        assert skill is not None
+        with check:
+            assert skill.main_content == "# CRLF Skill\n\nBody."
+        with check:
+            assert skill.layers == {"rules": "Rule 1.\nRule 2."}
+
+    def test_load_skill_content_repeated_load_reads_disk_once(self) -> None:
+        """Loading the same skill twice should return the cached instance without re-reading."""
+        # Act
+        first = generate_bundles.load_skill_content("test-skill")
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("unexpected read")):
+            second = generate_bundles.load_skill_content("test-skill")
+
+        # Assert
+        assert second is first
 
 
 # ============================================================================
@@ -497,6 +629,28 @@ class TestExtractQuickReference:
         with check:
             assert "Other content" not in quick_ref
 
+    def test_extract_quick_reference_excludes_surrounding_whitespace(self) -> None:
+        """Blank lines after the section should not be part of the result."""
+        # Arrange
+        content = "## Quick Reference\n\n| A | B |\n\n\n## Other\n\nMore.\n"
+
+        # Act
+        quick_ref = generate_bundles.extract_quick_reference(content)
+
+        # Assert
+        assert quick_ref == "## Quick Reference\n\n| A | B |"
+
+    def test_extract_quick_reference_subsection_heading_is_ignored(self) -> None:
+        """A '### Quick Reference' subsection should not be mistaken for the section."""
+        # Arrange
+        content = "# Skill\n\n## Usage\n\n### Quick Reference\n\nNested.\n"
+
+        # Act
+        quick_ref = generate_bundles.extract_quick_reference(content)
+
+        # Assert
+        assert quick_ref is None
+
     def test_extract_quick_reference_absent_returns_none(self) -> None:
         """Content without a Quick Reference section should return None."""
         # Arrange
@@ -598,42 +752,47 @@ class TestOrderLayers:
 class TestFormatLayers:
     """Tests for formatting layer content for bundles."""
 
-    def test_format_layers_empty_dict_returns_empty_list(self) -> None:
-        """Empty layers dict should return empty list."""
-        # Arrange / Act
-        lines = generate_bundles._format_layers("my-skill", {})
+    def test_format_layers_empty_list_writes_nothing(self) -> None:
+        """Empty layer list should leave the buffer empty."""
+        # Arrange
+        buf = io.StringIO()
+
+        # Act
+        generate_bundles._format_layers(buf, "my-skill", [])
 
         # Assert
-        assert lines == []
+        assert not buf.getvalue()
 
     def test_format_layers_with_content_includes_headers(self) -> None:
         """Non-empty layers should include HTML comment headers."""
         # Arrange
-        layers = {"rules": "Rule content here."}
+        layers = [("rules", "Rule content here.")]
+        buf = io.StringIO()
 
         # Act
-        lines = generate_bundles._format_layers("my-skill", layers)
+        generate_bundles._format_layers(buf, "my-skill", layers)
 
         # Assert
-        joined = "\n".join(lines)
+        joined = buf.getvalue()
         with check:
             assert "<!-- my-skill/rules -->" in joined
         with check:
             assert "Rule content here." in joined
 
-    def test_format_layers_preserves_order(self) -> None:
-        """Formatted layers should follow priority ordering."""
+    def test_format_layers_preserves_given_order(self) -> None:
+        """Formatted layers should be written in the order they are given."""
         # Arrange
-        layers = {"examples": "Example content", "rules": "Rule content"}
+        layers = [("examples", "Example content"), ("rules", "Rule content")]
+        buf = io.StringIO()
 
         # Act
-        lines = generate_bundles._format_layers("my-skill", layers)
+        generate_bundles._format_layers(buf, "my-skill", layers)
 
         # Assert
-        joined = "\n".join(lines)
+        joined = buf.getvalue()
         rules_pos = joined.index("my-skill/rules")
         examples_pos = joined.index("my-skill/examples")
-        assert rules_pos < examples_pos
+        assert examples_pos < rules_pos
 
 
 # ============================================================================
@@ -649,12 +808,13 @@ class TestBuildBundleHeader:
         # Arrange
         agent_name = "test-agent"
         timestamp = "2025-01-15T12:00:00Z"
+        buf = io.StringIO()
 
         # Act
-        lines = generate_bundles._build_bundle_header(agent_name, timestamp)
+        generate_bundles._build_bundle_header(buf, agent_name, timestamp)
 
         # Assert
-        joined = "\n".join(lines)
+        joined = buf.getvalue()
         with check:
             assert "# test-agent Context Bundle" in joined
         with check:
@@ -681,12 +841,13 @@ class TestBuildTableOfContents:
             "skill-a": {"name": "skill-a", "description": "First skill"},
             "skill-b": {"name": "skill-b", "description": "Second skill"},
         }
+        buf = io.StringIO()
 
         # Act
-        lines = generate_bundles._build_table_of_contents(dependencies, skills_lookup)
+        generate_bundles._build_table_of_contents(buf, dependencies, skills_lookup)
 
         # Assert
-        joined = "\n".join(lines)
+        joined = buf.getvalue()
         with check:
             assert "## Included Skills" in joined
         with check:
@@ -701,14 +862,13 @@ class TestBuildTableOfContents:
         # Arrange
         dependencies = ["missing-skill"]
         skills_lookup: dict[str, dict[str, Any]] = {}
+        buf = io.StringIO()
 
         # Act
-        lines = generate_bundles._build_table_of_contents(dependencies, skills_lookup)
+        generate_bundles._build_table_of_contents(buf, dependencies, skills_lookup)
 
         # Assert
-        joined = "\n".join(lines)
-        with check:
-            assert "**missing-skill**: " in joined
+        assert "**missing-skill**: " in buf.getvalue()
 
 
 # ============================================================================
@@ -726,12 +886,13 @@ class TestFormatSkillSection:
             main_content="# My Skill\n\nFull content.",
             layers={},
         )
+        buf = io.StringIO()
 
         # Act
-        lines = generate_bundles._format_skill_section("my-skill", skill, compact=False)
+        generate_bundles._format_skill_section(buf, "my-skill", skill, compact=False)
 
         # Assert
-        joined = "\n".join(lines)
+        joined = buf.getvalue()
         with check:
             assert "<!-- skill: my-skill -->" in joined
         with check:
@@ -746,12 +907,13 @@ class TestFormatSkillSection:
             main_content="# My Skill\n\nMain content.",
             layers={"rules": "Rule layer content."},
         )
+        buf = io.StringIO()
 
         # Act
-        lines = generate_bundles._format_skill_section("my-skill", skill, compact=False)
+        generate_bundles._format_skill_section(buf, "my-skill", skill, compact=False)
 
         # Assert
-        joined = "\n".join(lines)
+        joined = buf.getvalue()
         with check:
             assert "Main content." in joined
         with check:
@@ -770,12 +932,13 @@ class TestFormatSkillSection:
             ),
             layers={"rules": "Rule content."},
         )
+        buf = io.StringIO()
 
         # Act
-        lines = generate_bundles._format_skill_section("my-skill", skill, compact=True)
+        generate_bundles._format_skill_section(buf, "my-skill", skill, compact=True)
 
         # Assert
-        joined = "\n".join(lines)
+        joined = buf.getvalue()
         with check:
             assert "## my-skill" in joined
         with check:
@@ -792,12 +955,13 @@ class TestFormatSkillSection:
             main_content="# No QR Skill\n\nJust content here.",
             layers={},
         )
+        buf = io.StringIO()
 
         # Act
-        lines = generate_bundles._format_skill_section("no-qr-skill", skill, compact=True)
+        generate_bundles._format_skill_section(buf, "no-qr-skill", skill, compact=True)
 
         # Assert
-        joined = "\n".join(lines)
+        joined = buf.getvalue()
         with check:
             assert "Just content here." in joined
         with check:
@@ -809,15 +973,12 @@ class TestFormatSkillSection:
 # ============================================================================
 
 
+@pytest.mark.usefixtures("patched_skills_dir")
 class TestGenerateBundle:
     """Tests for full bundle generation."""
 
-    def test_generate_bundle_full_mode_includes_all_skills(self, skills_dir: Path) -> None:
-        """Full bundle should include header, TOC, and all skill content.
-
-        Args:
-            skills_dir (Path): Temporary skills directory fixture.
-        """
+    def test_generate_bundle_full_mode_includes_all_skills(self) -> None:
+        """Full bundle should include header, TOC, and all skill content."""
         # Arrange
         agent_config: dict[str, Any] = {
             "name": "test-agent",
@@ -829,8 +990,7 @@ class TestGenerateBundle:
         }
 
         # Act
-        with patch.object(generate_bundles, "SKILLS_DIR", skills_dir):
-            bundle = generate_bundles.generate_bundle("test-agent", agent_config, skills_lookup, compact=False)
+        bundle = generate_bundles.generate_bundle("test-agent", agent_config, skills_lookup, compact=False)
 
         # Assert
         with check:
@@ -846,12 +1006,22 @@ class TestGenerateBundle:
         with check:
             assert "Simple content." in bundle
 
-    def test_generate_bundle_compact_mode_uses_quick_ref(self, skills_dir: Path) -> None:
-        """Compact bundle should use Quick Reference sections where available.
+    def test_generate_bundle_ends_with_single_newline_after_separator(self) -> None:
+        """Bundle should end with the final section separator and exactly one newline."""
+        # Arrange
+        agent_config: dict[str, Any] = {"name": "test-agent", "depends_on_skills": ["simple-skill"]}
 
-        Args:
-            skills_dir (Path): Temporary skills directory fixture.
-        """
+        # Act
+        bundle = generate_bundles.generate_bundle("test-agent", agent_config, {}, compact=False)
+
+        # Assert
+        with check:
+            assert bundle.endswith("Other content.\n\n---\n")
+        with check:
+            assert not bundle.endswith("\n\n")
+
+    def test_generate_bundle_compact_mode_uses_quick_ref(self) -> None:
+        """Compact bundle should use Quick Reference sections where available."""
         # Arrange
         agent_config: dict[str, Any] = {
             "name": "test-agent",
@@ -862,8 +1032,7 @@ class TestGenerateBundle:
         }
 
         # Act
-        with patch.object(generate_bundles, "SKILLS_DIR", skills_dir):
-            bundle = generate_bundles.generate_bundle("test-agent", agent_config, skills_lookup, compact=True)
+        bundle = generate_bundles.generate_bundle("test-agent", agent_config, skills_lookup, compact=True)
 
         # Assert
         with check:
@@ -873,11 +1042,10 @@ class TestGenerateBundle:
         with check:
             assert "Other content." not in bundle
 
-    def test_generate_bundle_skips_missing_skills(self, skills_dir: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    def test_generate_bundle_skips_missing_skills(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Bundle generation should exclude missing skills from both TOC and content.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
             capsys (pytest.CaptureFixture[str]): Pytest output capture fixture.
         """
         # Arrange
@@ -890,8 +1058,7 @@ class TestGenerateBundle:
         }
 
         # Act
-        with patch.object(generate_bundles, "SKILLS_DIR", skills_dir):
-            bundle = generate_bundles.generate_bundle("test-agent", agent_config, skills_lookup, compact=False)
+        bundle = generate_bundles.generate_bundle("test-agent", agent_config, skills_lookup, compact=False)
 
         # Assert - missing skill excluded from entire bundle (TOC and content)
         with check:
@@ -904,6 +1071,92 @@ class TestGenerateBundle:
         with check:
             assert "Warning: Skill not found: nonexistent-skill" in captured.out
 
+    def test_generate_bundle_missing_skill_warns_for_every_bundle(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """A cached miss should still print the not-found warning for each bundle.
+
+        Args:
+            capsys (pytest.CaptureFixture[str]): Pytest output capture fixture.
+        """
+        # Arrange
+        agent_config: dict[str, Any] = {"name": "test-agent", "depends_on_skills": ["missing-skill"]}
+
+        # Act
+        generate_bundles.generate_bundle("test-agent", agent_config, {})
+        generate_bundles.generate_bundle("test-agent", agent_config, {})
+        captured = capsys.readouterr()
+
+        # Assert
+        assert captured.out.count("Warning: Skill not found: missing-skill") == 2
+
+
+# ============================================================================
+# Test: _generate_bundles_for_agent
+# ============================================================================
+
+
+@pytest.mark.usefixtures("patched_skills_dir")
+class TestGenerateBundlesForAgent:
+    """Tests for generating the full and compact bundles from one dependency load."""
+
+    def test_generate_bundles_for_agent_bundles_share_preamble(self) -> None:
+        """Full and compact bundles should open with the same header and table of contents."""
+        # Arrange
+        agent_config: dict[str, Any] = {"name": "test-agent", "depends_on_skills": ["simple-skill"]}
+        skills_lookup: dict[str, dict[str, Any]] = {"simple-skill": {"description": "Simple skill"}}
+
+        # Act
+        full, compact = generate_bundles._generate_bundles_for_agent("test-agent", agent_config, skills_lookup)
+
+        # Assert
+        preamble_end = full.index("- **simple-skill**: Simple skill\n\n---\n\n") + len(
+            "- **simple-skill**: Simple skill\n\n---\n\n"
+        )
+        with check:
+            assert full.startswith("# test-agent Context Bundle")
+        with check:
+            assert compact[:preamble_end] == full[:preamble_end]
+
+    def test_generate_bundles_for_agent_returns_full_and_compact(self) -> None:
+        """Both bundles should be produced and match the single-mode generator output."""
+        # Arrange
+        agent_config: dict[str, Any] = {
+            "name": "test-agent",
+            "depends_on_skills": ["test-skill", "simple-skill"],
+        }
+        skills_lookup: dict[str, dict[str, Any]] = {
+            "test-skill": {"name": "test-skill", "description": "Test skill"},
+            "simple-skill": {"name": "simple-skill", "description": "Simple skill"},
+        }
+
+        # Act
+        with patch.object(generate_bundles, "_timestamp", return_value="2025-01-15T12:00:00Z"):
+            full, compact = generate_bundles._generate_bundles_for_agent("test-agent", agent_config, skills_lookup)
+            expected_full = generate_bundles.generate_bundle("test-agent", agent_config, skills_lookup, compact=False)
+            expected_compact = generate_bundles.generate_bundle("test-agent", agent_config, skills_lookup, compact=True)
+
+        # Assert
+        with check:
+            assert full == expected_full
+        with check:
+            assert compact == expected_compact
+
+    def test_generate_bundles_for_agent_loads_each_dependency_once(self) -> None:
+        """Each dependency should be loaded once even though two bundles are rendered."""
+        # Arrange
+        agent_config: dict[str, Any] = {
+            "name": "test-agent",
+            "depends_on_skills": ["test-skill", "simple-skill"],
+        }
+
+        # Act
+        with patch.object(
+            generate_bundles, "load_skill_content", wraps=generate_bundles.load_skill_content
+        ) as mock_load:
+            generate_bundles._generate_bundles_for_agent("test-agent", agent_config, {})
+
+        # Assert
+        assert mock_load.call_count == 2
+
 
 # ============================================================================
 # Test: _build_skills_lookup
@@ -1007,25 +1260,69 @@ class TestWriteBundle:
         captured = capsys.readouterr()
         assert "bundles/agent.md" in captured.out
 
+    def test_write_bundle_only_timestamp_changed_skips_write(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A bundle differing only in its Generated line should be left untouched.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+            capsys (pytest.CaptureFixture[str]): Pytest output capture fixture.
+        """
+        # Arrange
+        bundle_path = tmp_path / "agent.md"
+        existing = "# Bundle\n\nGenerated: 2025-01-15T12:00:00Z\n\nBody\n"
+        bundle_path.write_text(existing, encoding="utf-8")
+        os.utime(bundle_path, ns=(0, 0))
+
+        # Act
+        with patch.object(generate_bundles, "CLAUDE_DIR", tmp_path):
+            generate_bundles._write_bundle(bundle_path, existing.replace("2025-01-15", "2026-02-20"))
+
+        # Assert
+        with check:
+            assert bundle_path.read_text(encoding="utf-8") == existing
+        with check:
+            assert bundle_path.stat().st_mtime_ns == 0
+        with check:
+            assert "Unchanged: agent.md" in capsys.readouterr().out
+
+    def test_write_bundle_changed_body_rewrites_file(self, tmp_path: Path) -> None:
+        """A bundle whose body changed should be rewritten even if the size matches.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+        """
+        # Arrange
+        bundle_path = tmp_path / "agent.md"
+        bundle_path.write_text("# Bundle\n\nGenerated: 2025-01-15T12:00:00Z\n\nOld!\n", encoding="utf-8")
+        content = "# Bundle\n\nGenerated: 2025-01-15T12:00:00Z\n\nNew!\n"
+
+        # Act
+        with patch.object(generate_bundles, "CLAUDE_DIR", tmp_path):
+            generate_bundles._write_bundle(bundle_path, content)
+
+        # Assert
+        assert bundle_path.read_text(encoding="utf-8") == content
+
 
 # ============================================================================
 # Test: _process_agent
 # ============================================================================
 
 
+@pytest.mark.usefixtures("patched_paths")
 class TestProcessAgent:
     """Tests for processing a single agent's bundle generation."""
 
     def test_process_agent_dry_run_does_not_write_files(
         self,
-        skills_dir: Path,
         bundles_dir: Path,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Dry run mode should not create any files on disk.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
             bundles_dir (Path): Temporary bundles directory fixture.
             capsys (pytest.CaptureFixture[str]): Pytest output capture fixture.
         """
@@ -1039,11 +1336,7 @@ class TestProcessAgent:
         }
 
         # Act
-        with (
-            patch.object(generate_bundles, "SKILLS_DIR", skills_dir),
-            patch.object(generate_bundles, "BUNDLES_DIR", bundles_dir),
-        ):
-            generate_bundles._process_agent(agent_config, skills_lookup, dry_run=True)
+        generate_bundles._process_agent(agent_config, skills_lookup, dry_run=True)
 
         # Assert
         captured = capsys.readouterr()
@@ -1056,13 +1349,11 @@ class TestProcessAgent:
 
     def test_process_agent_normal_mode_writes_both_bundles(
         self,
-        skills_dir: Path,
         bundles_dir: Path,
     ) -> None:
         """Normal mode should write both full and compact bundle files.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
             bundles_dir (Path): Temporary bundles directory fixture.
         """
         # Arrange
@@ -1075,12 +1366,7 @@ class TestProcessAgent:
         }
 
         # Act
-        with (
-            patch.object(generate_bundles, "SKILLS_DIR", skills_dir),
-            patch.object(generate_bundles, "BUNDLES_DIR", bundles_dir),
-            patch.object(generate_bundles, "CLAUDE_DIR", bundles_dir.parent),
-        ):
-            generate_bundles._process_agent(agent_config, skills_lookup, dry_run=False)
+        generate_bundles._process_agent(agent_config, skills_lookup, dry_run=False)
 
         # Assert
         with check:
@@ -1096,35 +1382,64 @@ class TestProcessAgent:
             assert "# test-agent Context Bundle" in compact_content
 
 
+# ============================================================================
+# Test: _prefetch_skills
+# ============================================================================
+
+
+@pytest.mark.usefixtures("patched_skills_dir")
+class TestPrefetchSkills:
+    """Tests for loading all agent dependencies into the skill cache up front."""
+
+    def test_prefetch_skills_populates_cache_for_all_dependencies(self) -> None:
+        """After prefetching, every dependency should load without touching the disk."""
+        # Arrange
+        agent_configs: list[dict[str, Any]] = [
+            {"name": "agent-a", "depends_on_skills": ["test-skill", "simple-skill"]},
+            {"name": "agent-b", "depends_on_skills": ["simple-skill", "no-qr-skill"]},
+        ]
+
+        # Act
+        generate_bundles._prefetch_skills(agent_configs)
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("unexpected read")):
+            loaded = [
+                generate_bundles.load_skill_content(name) for name in ("test-skill", "simple-skill", "no-qr-skill")
+            ]
+
+        # Assert
+        assert all(skill is not None for skill in loaded)
+
+    def test_prefetch_skills_no_dependencies_loads_nothing(self) -> None:
+        """Agents without dependencies should not trigger any skill loads."""
+        # Act
+        with patch.object(generate_bundles, "_load_skill_dir") as mock_load:
+            generate_bundles._prefetch_skills([{"name": "agent-a"}])
+
+        # Assert
+        mock_load.assert_not_called()
+
+
 # ============================================================================
 # Test: generate_all_bundles
 # ============================================================================
 
 
+@pytest.mark.usefixtures("patched_paths")
 class TestGenerateAllBundles:
     """Tests for the top-level bundle generation orchestrator."""
 
     def test_generate_all_bundles_with_agent_filter(
         self,
-        skills_dir: Path,
         bundles_dir: Path,
-        manifest_file: Path,
     ) -> None:
         """Agent filter should only generate bundles for the matching agent.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
             bundles_dir (Path): Temporary bundles directory fixture.
-            manifest_file (Path): Temporary manifest file fixture.
         """
         # Act
-        with (
-            patch.object(generate_bundles, "SKILLS_DIR", skills_dir),
-            patch.object(generate_bundles, "BUNDLES_DIR", bundles_dir),
-            patch.object(generate_bundles, "MANIFEST_PATH", manifest_file),
-            patch.object(generate_bundles, "CLAUDE_DIR", bundles_dir.parent),
-        ):
-            generate_bundles.generate_all_bundles(dry_run=False, agent_filter="test-agent")
+        generate_bundles.generate_all_bundles(dry_run=False, agent_filter="test-agent")
 
         # Assert
         with check:
@@ -1134,51 +1449,136 @@ class TestGenerateAllBundles:
 
     def test_generate_all_bundles_filter_nonexistent_agent_writes_nothing(
         self,
-        skills_dir: Path,
         bundles_dir: Path,
-        manifest_file: Path,
     ) -> None:
         """Filtering for a non-existent agent should produce no bundle files.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
             bundles_dir (Path): Temporary bundles directory fixture.
-            manifest_file (Path): Temporary manifest file fixture.
         """
         # Act
-        with (
-            patch.object(generate_bundles, "SKILLS_DIR", skills_dir),
-            patch.object(generate_bundles, "BUNDLES_DIR", bundles_dir),
-            patch.object(generate_bundles, "MANIFEST_PATH", manifest_file),
-            patch.object(generate_bundles, "CLAUDE_DIR", bundles_dir.parent),
-        ):
-            generate_bundles.generate_all_bundles(dry_run=False, agent_filter="nonexistent-agent")
+        generate_bundles.generate_all_bundles(dry_run=False, agent_filter="nonexistent-agent")
 
         # Assert - only the pre-existing bundles dir, no new files
         bundle_files = list(bundles_dir.glob("*.md"))
         assert bundle_files == []
 
+    def test_generate_all_bundles_multiple_agents_reports_in_manifest_order(
+        self,
+        bundles_dir: Path,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Every agent should write its bundles and report in manifest order.
+
+        Args:
+            bundles_dir (Path): Temporary bundles directory fixture.
+            capsys (pytest.CaptureFixture[str]): Pytest output capture fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+        """
+        # Arrange
+        agent_names = ["zeta-agent", "alpha-agent", "mid-agent", "beta-agent"]
+        manifest_path = bundles_dir.parent / "manifest.json"
+        manifest_path.write_text(
+            json.dumps({
+                "skills": [],
+                "agents": [
+                    {"name": name, "depends_on_skills": ["simple-skill", "missing-skill"]} for name in agent_names
+                ],
+            })
+        )
+        monkeypatch.setattr(generate_bundles, "MANIFEST_PATH", manifest_path)
+
+        # Act
+        generate_bundles.generate_all_bundles()
+        output = capsys.readouterr().out
+
+        # Assert
+        with check:
+            assert sorted(path.name for path in bundles_dir.glob("*.md")) == sorted(
+                f"{name}{suffix}.md" for name in agent_names for suffix in ("", "-compact")
+            )
+        with check:
+            assert [
+                line.removeprefix("Generating bundle for: ") for line in output.splitlines() if "Generating" in line
+            ] == agent_names
+        with check:
+            assert output.count("Warning: Skill not found: missing-skill") == len(agent_names)
+
+    def test_generate_all_bundles_rereads_skills_edited_between_runs(
+        self, tmp_path: Path, bundles_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A second run in the same process should pick up skill edits made after the first.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+            bundles_dir (Path): Temporary bundles directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+        """
+        # Arrange
+        skill_path = tmp_path / "skills" / "edited-skill" / "SKILL.md"
+        skill_path.parent.mkdir(parents=True)
+        skill_path.write_text("# Edited Skill\n\nOriginal content.\n")
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(
+            json.dumps({"skills": [], "agents": [{"name": "test-agent", "depends_on_skills": ["edited-skill"]}]})
+        )
+        monkeypatch.setattr(generate_bundles, "SKILLS_DIR", skill_path.parent.parent)
+        monkeypatch.setattr(generate_bundles, "MANIFEST_PATH", manifest_path)
+
+        # Act
+        generate_bundles.generate_all_bundles()
+        skill_path.write_text("# Edited Skill\n\nUpdated content.\n")
+        generate_bundles.generate_all_bundles()
+
+        # Assert
+        bundle = (bundles_dir / "test-agent.md").read_text()
+        with check:
+            assert "Updated content." in bundle
+        with check:
+            assert "Original content." not in bundle
+
+    def test_generate_all_bundles_up_to_date_agent_is_skipped_unless_forced(
+        self,
+        bundles_dir: Path,
+    ) -> None:
+        """Bundles newer than all their inputs should only be rebuilt with force.
+
+        Args:
+            bundles_dir (Path): Temporary bundles directory fixture.
+        """
+        # Arrange
+        generate_bundles.generate_all_bundles()
+        # Push the bundles clearly past their inputs regardless of timestamp granularity
+        for bundle in bundles_dir.glob("*.md"):
+            future = bundle.stat().st_mtime_ns + 10**10
+            os.utime(bundle, ns=(future, future))
+
+        # Act
+        with patch.object(
+            generate_bundles, "_generate_bundles_for_agent", wraps=generate_bundles._generate_bundles_for_agent
+        ) as mock_generate:
+            generate_bundles.generate_all_bundles()
+            skipped_calls = mock_generate.call_count
+            generate_bundles.generate_all_bundles(force=True)
+
+        # Assert
+        with check:
+            assert skipped_calls == 0
+        with check:
+            assert mock_generate.call_count == 1
+
     def test_generate_all_bundles_dry_run_creates_no_files(
         self,
-        skills_dir: Path,
         bundles_dir: Path,
-        manifest_file: Path,
     ) -> None:
         """Dry run should not create any bundle files.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
             bundles_dir (Path): Temporary bundles directory fixture.
-            manifest_file (Path): Temporary manifest file fixture.
         """
         # Act
-        with (
-            patch.object(generate_bundles, "SKILLS_DIR", skills_dir),
-            patch.object(generate_bundles, "BUNDLES_DIR", bundles_dir),
-            patch.object(generate_bundles, "MANIFEST_PATH", manifest_file),
-            patch.object(generate_bundles, "CLAUDE_DIR", bundles_dir.parent),
-        ):
-            generate_bundles.generate_all_bundles(dry_run=True, agent_filter=None)
+        generate_bundles.generate_all_bundles(dry_run=True, agent_filter=None)
 
         # Assert
         bundle_files = list(bundles_dir.glob("*.md"))
@@ -1186,16 +1586,16 @@ class TestGenerateAllBundles:
 
     def test_generate_all_bundles_no_agents_key_writes_nothing(
         self,
-        skills_dir: Path,
         bundles_dir: Path,
         tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Manifest without 'agents' key should produce no bundle files.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
             bundles_dir (Path): Temporary bundles directory fixture.
             tmp_path (Path): Pytest temporary directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
         """
         # Arrange - manifest with skills but no agents key
         manifest = {
@@ -1205,15 +1605,10 @@ class TestGenerateAllBundles:
         }
         manifest_path = tmp_path / "manifest.json"
         manifest_path.write_text(json.dumps(manifest))
+        monkeypatch.setattr(generate_bundles, "MANIFEST_PATH", manifest_path)
 
         # Act
-        with (
-            patch.object(generate_bundles, "SKILLS_DIR", skills_dir),
-            patch.object(generate_bundles, "BUNDLES_DIR", bundles_dir),
-            patch.object(generate_bundles, "MANIFEST_PATH", manifest_path),
-            patch.object(generate_bundles, "CLAUDE_DIR", bundles_dir.parent),
-        ):
-            generate_bundles.generate_all_bundles(dry_run=False, agent_filter=None)
+        generate_bundles.generate_all_bundles(dry_run=False, agent_filter=None)
 
         # Assert
         bundle_files = list(bundles_dir.glob("*.md"))
@@ -1221,16 +1616,16 @@ class TestGenerateAllBundles:
 
     def test_generate_all_bundles_without_filter_generates_for_all_agents(
         self,
-        skills_dir: Path,
         bundles_dir: Path,
         tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Without filter, bundles should be generated for all agents in the manifest.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
             bundles_dir (Path): Temporary bundles directory fixture.
             tmp_path (Path): Pytest temporary directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
         """
         # Arrange - manifest with two agents
         manifest = {
@@ -1256,15 +1651,10 @@ class TestGenerateAllBundles:
         }
         manifest_path = tmp_path / "manifest.json"
         manifest_path.write_text(json.dumps(manifest))
+        monkeypatch.setattr(generate_bundles, "MANIFEST_PATH", manifest_path)
 
         # Act
-        with (
-            patch.object(generate_bundles, "SKILLS_DIR", skills_dir),
-            patch.object(generate_bundles, "BUNDLES_DIR", bundles_dir),
-            patch.object(generate_bundles, "MANIFEST_PATH", manifest_path),
-            patch.object(generate_bundles, "CLAUDE_DIR", bundles_dir.parent),
-        ):
-            generate_bundles.generate_all_bundles(dry_run=False, agent_filter=None)
+        generate_bundles.generate_all_bundles(dry_run=False, agent_filter=None)
 
         # Assert
         with check:
@@ -1277,6 +1667,92 @@ class TestGenerateAllBundles:
             assert (bundles_dir / "agent-two-compact.md").exists()
 
 
+# ============================================================================
+# Test: _bundles_up_to_date
+# ============================================================================
+
+
+@pytest.mark.usefixtures("patched_paths")
+class TestBundlesUpToDate:
+    """Tests for deciding whether an agent's bundles need regenerating."""
+
+    def test_bundles_up_to_date_older_bundles_with_current_content_returns_true(
+        self, bundles_dir: Path, manifest_data: dict[str, Any]
+    ) -> None:
+        """Bundles older than their inputs but with current content should count as up to date.
+
+        Args:
+            bundles_dir (Path): Temporary bundles directory fixture.
+            manifest_data (dict[str, Any]): The manifest data fixture.
+        """
+        # Arrange - as after a checkout, the bundles are no newer than their inputs
+        generate_bundles.generate_all_bundles(force=True)
+        for bundle in bundles_dir.glob("*.md"):
+            os.utime(bundle, ns=(0, 0))
+        skills_lookup = generate_bundles._build_skills_lookup(manifest_data)
+
+        # Act
+        up_to_date = generate_bundles._bundles_up_to_date(manifest_data["agents"][0], skills_lookup)
+
+        # Assert
+        assert up_to_date is True
+
+    def test_bundles_up_to_date_changed_content_returns_false(
+        self, bundles_dir: Path, manifest_data: dict[str, Any]
+    ) -> None:
+        """An older bundle whose content no longer matches its inputs should be stale.
+
+        Args:
+            bundles_dir (Path): Temporary bundles directory fixture.
+            manifest_data (dict[str, Any]): The manifest data fixture.
+        """
+        # Arrange
+        generate_bundles.generate_all_bundles(force=True)
+        compact = bundles_dir / "test-agent-compact.md"
+        compact.write_text(compact.read_text(encoding="utf-8") + "Stale line.\n", encoding="utf-8")
+        os.utime(compact, ns=(0, 0))
+        skills_lookup = generate_bundles._build_skills_lookup(manifest_data)
+
+        # Act
+        up_to_date = generate_bundles._bundles_up_to_date(manifest_data["agents"][0], skills_lookup)
+
+        # Assert
+        assert up_to_date is False
+
+    def test_bundles_newer_than_inputs_nested_edit_returns_false(
+        self, tmp_path: Path, bundles_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A file edited in a subdirectory of a skill should defeat the mtime fast path.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+            bundles_dir (Path): Temporary bundles directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+        """
+        # Arrange
+        nested = tmp_path / "skills" / "nested-skill" / "layers"
+        nested.mkdir(parents=True)
+        (nested / "rules.md").write_text("Rule.", encoding="utf-8")
+        monkeypatch.setattr(generate_bundles, "SKILLS_DIR", tmp_path / "skills")
+
+        built = (nested / "rules.md").stat().st_mtime_ns + 10**10
+        for name in ("agent.md", "agent-compact.md"):
+            (bundles_dir / name).write_text("bundle", encoding="utf-8")
+            os.utime(bundles_dir / name, ns=(built, built))
+        fresh = generate_bundles._bundles_newer_than_inputs("agent", ["nested-skill"])
+        edited = built + 10**10
+        os.utime(nested / "rules.md", ns=(edited, edited))
+
+        # Act
+        after_edit = generate_bundles._bundles_newer_than_inputs("agent", ["nested-skill"])
+
+        # Assert
+        with check:
+            assert fresh is True
+        with check:
+            assert after_edit is False
+
+
 # ============================================================================
 # Test: _parse_args
 # ============================================================================
@@ -1296,6 +1772,8 @@ class TestParseArgs:
             assert args.dry_run is False
         with check:
             assert args.agent is None
+        with check:
+            assert args.force is False
 
     def test_parse_args_dry_run_flag_sets_true(self) -> None:
         """The --dry-run flag should set dry_run to True."""
@@ -1306,6 +1784,15 @@ class TestParseArgs:
         # Assert
         assert args.dry_run is True
 
+    def test_parse_args_force_flag_sets_true(self) -> None:
+        """The --force flag should set force to True."""
+        # Act
+        with patch("sys.argv", ["generate_bundles.py", "--force"]):
+            args = generate_bundles._parse_args()
+
+        # Assert
+        assert args.force is True
+
     def test_parse_args_agent_flag_sets_value(self) -> None:
         """The --agent flag should capture the agent name."""
         # Act
@@ -1333,30 +1820,21 @@ class TestParseArgs:
 # ============================================================================
 
 
+@pytest.mark.usefixtures("patched_paths")
 class TestMain:
     """Integration tests for the main entry point."""
 
     def test_main_runs_generate_all_bundles(
         self,
-        skills_dir: Path,
         bundles_dir: Path,
-        manifest_file: Path,
     ) -> None:
         """Main should parse args and call generate_all_bundles.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
             bundles_dir (Path): Temporary bundles directory fixture.
-            manifest_file (Path): Temporary manifest file fixture.
         """
         # Act
-        with (
-            patch("sys.argv", ["generate_bundles.py", "--agent", "test-agent"]),
-            patch.object(generate_bundles, "SKILLS_DIR", skills_dir),
-            patch.object(generate_bundles, "BUNDLES_DIR", bundles_dir),
-            patch.object(generate_bundles, "MANIFEST_PATH", manifest_file),
-            patch.object(generate_bundles, "CLAUDE_DIR", bundles_dir.parent),
-        ):
+        with patch("sys.argv", ["generate_bundles.py", "--agent", "test-agent"]):
             generate_bundles.main()
 
         # Assert
@@ -1367,25 +1845,15 @@ class TestMain:
 
     def test_main_dry_run_creates_no_files(
         self,
-        skills_dir: Path,
         bundles_dir: Path,
-        manifest_file: Path,
     ) -> None:
         """Main with --dry-run should not write any files.
 
         Args:
-            skills_dir (Path): Temporary skills directory fixture.
             bundles_dir (Path): Temporary bundles directory fixture.
-            manifest_file (Path): Temporary manifest file fixture.
         """
         # Act
-        with (
-            patch("sys.argv", ["generate_bundles.py", "--dry-run"]),
-            patch.object(generate_bundles, "SKILLS_DIR", skills_dir),
-            patch.object(generate_bundles, "BUNDLES_DIR", bundles_dir),
-            patch.object(generate_bundles, "MANIFEST_PATH", manifest_file),
-            patch.object(generate_bundles, "CLAUDE_DIR", bundles_dir.parent),
-        ):
+        with patch("sys.argv", ["generate_bundles.py", "--dry-run"]):
             generate_bundles.main()
 
         # Assert
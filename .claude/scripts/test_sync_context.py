@@ -10,9 +10,10 @@ section generation, bundle regeneration, and the main entry point.
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 import sync_context
@@ -25,6 +26,7 @@ from sync_context import (
     _generate_bundles_section,  # noqa: PLC2701
     _generate_commands_section,  # noqa: PLC2701
     _generate_skills_section,  # noqa: PLC2701
+    check_bundles,
     generate_claude_md_sections,
     load_manifest,
     parse_frontmatter,
@@ -68,109 +70,6 @@ def _write_md_file(directory: Path, filename: str, frontmatter: str, body: str =
     (directory / filename).write_text(content)
 
 
-# ============================================================================
-# Test: _parse_value
-# ============================================================================
-
-
-class TestParseValue:
-    """Tests for _parse_value private helper that converts frontmatter value strings."""
-
-    @pytest.mark.parametrize(
-        ("input_value", "expected"),
-        [
-            ("true", True),
-            ("True", True),
-            ("TRUE", True),
-            ("false", False),
-            ("False", False),
-            ("FALSE", False),
-        ],
-    )
-    def test_parse_value_boolean_strings_returns_bool(self, *, input_value: str, expected: bool) -> None:
-        """Boolean strings should be converted to Python bool regardless of case.
-
-        Args:
-            input_value (str): Input string like "true" or "False".
-            expected (bool): Expected boolean result.
-        """
-        # Act
-        parsed = sync_context._parse_value(input_value)
-
-        # Assert
-        assert parsed is expected
-
-    def test_parse_value_inline_list_returns_list(self) -> None:
-        """Bracket-delimited list should be parsed into a Python list of strings."""
-        # Act
-        parsed = sync_context._parse_value("[alpha, beta, gamma]")
-
-        # Assert
-        with check:
-            assert isinstance(parsed, list)
-        with check:
-            assert parsed == ["alpha", "beta", "gamma"]
-
-    def test_parse_value_inline_list_with_quotes_strips_quotes(self) -> None:
-        """Quoted items in inline list should have quotes stripped."""
-        # Act
-        parsed = sync_context._parse_value("[\" alpha \", 'beta']")
-
-        # Assert
-        assert parsed == [" alpha ", "beta"]
-
-    def test_parse_value_empty_inline_list_returns_empty_list(self) -> None:
-        """Empty bracket list should return an empty list."""
-        # Act
-        parsed = sync_context._parse_value("[]")
-
-        # Assert
-        assert parsed == []
-
-    def test_parse_value_regular_string_returns_string(self) -> None:
-        """Non-boolean, non-list values should be returned as-is."""
-        # Act
-        parsed = sync_context._parse_value("some description text")
-
-        # Assert
-        with check:
-            assert isinstance(parsed, str)
-        with check:
-            assert parsed == "some description text"
-
-    def test_parse_value_quoted_string_preserves_quotes(self) -> None:
-        """Quoted standalone string should NOT have quotes stripped by _parse_value.
-
-        Quote stripping happens in parse_frontmatter at the key-value level,
-        not in _parse_value. This documents that _parse_value is pass-through for quotes.
-        """
-        # Act
-        parsed = sync_context._parse_value('"quoted"')
-
-        # Assert
-        assert parsed == '"quoted"'
-
-    @pytest.mark.parametrize(
-        ("input_value", "expected"),
-        [
-            ("", ""),
-            (" true ", " true "),
-        ],
-    )
-    def test_parse_value_non_boolean_lookalikes_returns_string(self, *, input_value: str, expected: str) -> None:
-        """Empty string and whitespace-padded booleans should pass through as strings.
-
-        Args:
-            input_value (str): Input that looks like it could be boolean.
-            expected (str): Expected string result (not converted to bool).
-        """
-        # Act
-        parsed = sync_context._parse_value(input_value)
-
-        # Assert
-        assert parsed == expected
-
-
 # ============================================================================
 # Test: parse_frontmatter
 # ============================================================================
@@ -309,6 +208,28 @@ class TestParseFrontmatter:
         # Assert
         assert frontmatter["description"] == "See http://example.com for details"
 
+    def test_parse_frontmatter_malformed_yaml_warns_and_returns_empty_dict(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Frontmatter that is not valid YAML should be ignored with a warning naming the source.
+
+        Args:
+            capsys (pytest.CaptureFixture[str]): Pytest capture fixture.
+        """
+        # Arrange - an unquoted second colon makes the value an invalid mapping
+        content = "---\ndescription: Foo: bar baz\n---\nBody text"
+
+        # Act
+        frontmatter, body = parse_frontmatter(content, "skills/bad/SKILL.md")
+
+        # Assert
+        with check:
+            assert frontmatter == {}
+        with check:
+            assert body == "Body text"
+        with check:
+            assert "skills/bad/SKILL.md" in capsys.readouterr().err
+
     def test_parse_frontmatter_multiline_list_at_end_returns_list(self) -> None:
         """Multi-line list as the last key in frontmatter should be captured correctly."""
         # Arrange
@@ -335,15 +256,40 @@ class TestParseFrontmatter:
         assert frontmatter["items"] == [" alpha ", "beta"]
 
     def test_parse_frontmatter_value_with_apostrophe_at_end(self) -> None:
-        """Trailing apostrophe is stripped by the greedy strip in parse_frontmatter."""
+        """Apostrophes inside an unquoted value are kept as literal characters."""
         # Arrange
         content = "---\ndescription: It's a test'\n---\n"
 
         # Act
         frontmatter, _ = parse_frontmatter(content)
 
-        # Assert - documents current behavior: trailing apostrophe is stripped
-        assert frontmatter["description"] == "It's a test"
+        # Assert
+        assert frontmatter["description"] == "It's a test'"
+
+    def test_parse_frontmatter_nested_mapping_returns_dict(self) -> None:
+        """Nested mappings (e.g., skill layers) should be parsed into nested dicts."""
+        # Arrange
+        content = "---\nname: test\nlayers:\n  rules: rules.md\n  examples: examples.md\n---\nBody"
+
+        # Act
+        frontmatter, _ = parse_frontmatter(content)
+
+        # Assert
+        assert frontmatter["layers"] == {"rules": "rules.md", "examples": "examples.md"}
+
+    def test_parse_frontmatter_non_mapping_block_returns_empty_dict(self) -> None:
+        """Frontmatter that is not a key-value mapping should be treated as empty."""
+        # Arrange
+        content = "---\njust some text\n---\nBody"
+
+        # Act
+        frontmatter, body = parse_frontmatter(content)
+
+        # Assert
+        with check:
+            assert frontmatter == {}
+        with check:
+            assert body == "Body"
 
 
 # ============================================================================
@@ -459,41 +405,34 @@ class TestScanSkills:
             assert "valid-skill" in skills
 
     def test_scan_skills_no_description_falls_back_to_content_line(self, tmp_path: Path) -> None:
-        """Skill without description frontmatter should use first non-header content line.
+        """Skill without description frontmatter should use first non-header body line.
 
-        The fallback logic iterates all lines of the file (including frontmatter).
-        Lines starting with '#' or '-' are skipped. The first non-empty, non-skipped
-        line becomes the description -- which is the first frontmatter key-value line.
+        The fallback only looks at the body after the frontmatter, skipping lines
+        that start with '#' or '-'.
 
         Args:
             tmp_path (Path): Pytest temporary directory fixture.
         """
-        # Arrange - the fallback iterates full file content, so frontmatter
-        # lines like "name: no-desc" are candidates (they don't start with # or -)
+        # Arrange
         _write_skill(
             tmp_path / "no-desc",
             "name: no-desc\nversion: 1.0.0",
-            body="\n# Heading\n\nThis is the fallback description line.",
+            body="\n# Heading\n\n- list item\n\nThis is the fallback description line.",
         )
 
         # Act
         skills = scan_skills()
 
-        # Assert - first non-empty line not starting with # or - is "name: no-desc"
-        assert skills["no-desc"].description == "name: no-desc"
+        # Assert
+        assert skills["no-desc"].description == "This is the fallback description line."
 
     def test_scan_skills_no_description_body_only_text_returns_body_line(self, tmp_path: Path) -> None:
-        """Skill without description and with body text should pick up a content line.
-
-        When the frontmatter has no description and the file body has plain text
-        lines (not starting with # or -), the first such line from the full content
-        is used. If frontmatter keys come first, they win the fallback.
+        """Skill without any frontmatter should pick up the first plain body line.
 
         Args:
             tmp_path (Path): Pytest temporary directory fixture.
         """
-        # Arrange - create a SKILL.md with no frontmatter at all, so fallback
-        # iterates from the body directly
+        # Arrange - create a SKILL.md with no frontmatter at all
         skill_dir = tmp_path / "plain-skill"
         skill_dir.mkdir()
         (skill_dir / "SKILL.md").write_text("# Heading\n\nPlain description text here.")
@@ -504,6 +443,79 @@ class TestScanSkills:
         # Assert - first line not starting with # or - is "Plain description text here."
         assert skills["plain-skill"].description == "Plain description text here."
 
+    def test_scan_skills_no_description_skips_blank_crlf_lines(self, tmp_path: Path) -> None:
+        """Blank lines in CRLF files should not be taken as the fallback description.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+        """
+        # Arrange - written as bytes so the CRLF line endings reach the parser untranslated
+        skill_dir = tmp_path / "crlf-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_bytes(b"# Heading\r\n\r\n   \r\n  CRLF description.\r\n")
+
+        # Act
+        skills = scan_skills()
+
+        # Assert
+        assert skills["crlf-skill"].description == "CRLF description."
+
+    def test_scan_skills_crlf_frontmatter_is_parsed(self, tmp_path: Path) -> None:
+        """Frontmatter in a CRLF file should be parsed rather than treated as body text.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+        """
+        # Arrange - written as bytes so the CRLF line endings reach the parser untranslated
+        skill_dir = tmp_path / "crlf-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_bytes(
+            b"---\r\nname: crlf-skill\r\ndescription: From YAML.\r\nuser-invocable: false\r\n---\r\n\r\nBody.\r\n"
+        )
+
+        # Act
+        skills = scan_skills()
+
+        # Assert
+        with check:
+            assert skills["crlf-skill"].description == "From YAML."
+        with check:
+            assert skills["crlf-skill"].user_invocable is False
+
+    def test_scan_skills_malformed_frontmatter_still_scans_skill(self, tmp_path: Path) -> None:
+        """A skill with unparseable frontmatter should fall back to its body instead of aborting the scan.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+        """
+        # Arrange
+        _write_skill(tmp_path / "bad-skill", "description: Foo: bar baz", "Body description.")
+        _write_skill(tmp_path / "good-skill", "description: Fine.")
+
+        # Act
+        skills = scan_skills()
+
+        # Assert
+        with check:
+            assert skills["bad-skill"].description == "Body description."
+        with check:
+            assert skills["good-skill"].description == "Fine."
+
+    def test_scan_skills_no_description_and_no_body_text_returns_empty(self, tmp_path: Path) -> None:
+        """Skill with neither a description nor plain body text should get an empty description.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+        """
+        # Arrange
+        _write_skill(tmp_path / "headings-only", "name: headings-only", body="# Heading\n\n- item")
+
+        # Act
+        skills = scan_skills()
+
+        # Assert
+        assert not skills["headings-only"].description
+
     def test_scan_skills_defaults_name_to_directory_name(self, tmp_path: Path) -> None:
         """Skill without name in frontmatter should default to directory name.
 
@@ -563,6 +575,16 @@ class TestScanSkills:
 class TestScanAgents:
     """Tests for scan_agents that discovers agent metadata from the filesystem."""
 
+    @pytest.fixture(autouse=True)
+    def _patch_agents_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Patch AGENTS_DIR to tmp_path for all tests in this class.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+        """
+        monkeypatch.setattr(sync_context, "AGENTS_DIR", tmp_path)
+
     def test_scan_agents_valid_directory_returns_agent_info(self, tmp_path: Path) -> None:
         """Directory with valid agent markdown files should return populated AgentInfo dict.
 
@@ -577,8 +599,7 @@ class TestScanAgents:
         )
 
         # Act
-        with patch.object(sync_context, "AGENTS_DIR", tmp_path):
-            agents = scan_agents()
+        agents = scan_agents()
 
         # Assert
         with check:
@@ -590,31 +611,29 @@ class TestScanAgents:
         with check:
             assert agents["my-agent"].version == "1.1.0"
 
-    def test_scan_agents_empty_directory_returns_empty_dict(self, tmp_path: Path) -> None:
-        """Empty agents directory should return empty dict.
-
-        Args:
-            tmp_path (Path): Pytest temporary directory fixture.
-        """
+    def test_scan_agents_empty_directory_returns_empty_dict(self) -> None:
+        """Empty agents directory should return empty dict."""
         # Act
-        with patch.object(sync_context, "AGENTS_DIR", tmp_path):
-            agents = scan_agents()
+        agents = scan_agents()
 
         # Assert
         assert agents == {}
 
-    def test_scan_agents_nonexistent_directory_returns_empty_dict(self, tmp_path: Path) -> None:
+    def test_scan_agents_nonexistent_directory_returns_empty_dict(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Non-existent agents directory should return empty dict.
 
         Args:
             tmp_path (Path): Pytest temporary directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
         """
         # Arrange
         nonexistent = tmp_path / "does-not-exist"
+        monkeypatch.setattr(sync_context, "AGENTS_DIR", nonexistent)
 
         # Act
-        with patch.object(sync_context, "AGENTS_DIR", nonexistent):
-            agents = scan_agents()
+        agents = scan_agents()
 
         # Assert
         assert agents == {}
@@ -629,8 +648,7 @@ class TestScanAgents:
         _write_md_file(tmp_path, "code-writer.md", "description: Writes code\nmodel: opus")
 
         # Act
-        with patch.object(sync_context, "AGENTS_DIR", tmp_path):
-            agents = scan_agents()
+        agents = scan_agents()
 
         # Assert
         assert "code-writer" in agents
@@ -647,8 +665,7 @@ class TestScanAgents:
         (tmp_path / "config.json").write_text("{}")
 
         # Act
-        with patch.object(sync_context, "AGENTS_DIR", tmp_path):
-            agents = scan_agents()
+        agents = scan_agents()
 
         # Assert
         with check:
@@ -656,6 +673,22 @@ class TestScanAgents:
         with check:
             assert "valid-agent" in agents
 
+    def test_scan_agents_skips_directories_with_md_suffix(self, tmp_path: Path) -> None:
+        """Directories whose names end in .md should not be treated as agent files.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+        """
+        # Arrange
+        _write_md_file(tmp_path, "valid-agent.md", "name: valid-agent\ndescription: Valid\nmodel: opus")
+        (tmp_path / "archive.md").mkdir()
+
+        # Act
+        agents = scan_agents()
+
+        # Assert
+        assert list(agents) == ["valid-agent"]
+
     def test_scan_agents_with_depends_on_skills_returns_list(self, tmp_path: Path) -> None:
         """Agent with depends_on_skills should parse them into a list.
 
@@ -670,8 +703,7 @@ class TestScanAgents:
         )
 
         # Act
-        with patch.object(sync_context, "AGENTS_DIR", tmp_path):
-            agents = scan_agents()
+        agents = scan_agents()
 
         # Assert
         assert agents["my-agent"].depends_on_skills == ["skill-a", "skill-b"]
@@ -685,6 +717,16 @@ class TestScanAgents:
 class TestScanCommands:
     """Tests for scan_commands that discovers command metadata from the filesystem."""
 
+    @pytest.fixture(autouse=True)
+    def _patch_commands_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Patch COMMANDS_DIR to tmp_path for all tests in this class.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+        """
+        monkeypatch.setattr(sync_context, "COMMANDS_DIR", tmp_path)
+
     def test_scan_commands_valid_directory_returns_command_info(self, tmp_path: Path) -> None:
         """Directory with valid command markdown files should return populated CommandInfo dict.
 
@@ -699,8 +741,7 @@ class TestScanCommands:
         )
 
         # Act
-        with patch.object(sync_context, "COMMANDS_DIR", tmp_path):
-            commands = scan_commands()
+        commands = scan_commands()
 
         # Assert
         with check:
@@ -710,31 +751,29 @@ class TestScanCommands:
         with check:
             assert commands["clean"].version == "1.2.0"
 
-    def test_scan_commands_empty_directory_returns_empty_dict(self, tmp_path: Path) -> None:
-        """Empty commands directory should return empty dict.
-
-        Args:
-            tmp_path (Path): Pytest temporary directory fixture.
-        """
+    def test_scan_commands_empty_directory_returns_empty_dict(self) -> None:
+        """Empty commands directory should return empty dict."""
         # Act
-        with patch.object(sync_context, "COMMANDS_DIR", tmp_path):
-            commands = scan_commands()
+        commands = scan_commands()
 
         # Assert
         assert commands == {}
 
-    def test_scan_commands_nonexistent_directory_returns_empty_dict(self, tmp_path: Path) -> None:
+    def test_scan_commands_nonexistent_directory_returns_empty_dict(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Non-existent commands directory should return empty dict.
 
         Args:
             tmp_path (Path): Pytest temporary directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
         """
         # Arrange
         nonexistent = tmp_path / "does-not-exist"
+        monkeypatch.setattr(sync_context, "COMMANDS_DIR", nonexistent)
 
         # Act
-        with patch.object(sync_context, "COMMANDS_DIR", nonexistent):
-            commands = scan_commands()
+        commands = scan_commands()
 
         # Assert
         assert commands == {}
@@ -749,8 +788,7 @@ class TestScanCommands:
         _write_md_file(tmp_path, "review.md", "description: Code review")
 
         # Act
-        with patch.object(sync_context, "COMMANDS_DIR", tmp_path):
-            commands = scan_commands()
+        commands = scan_commands()
 
         # Assert
         assert "review" in commands
@@ -767,8 +805,7 @@ class TestScanCommands:
         (tmp_path / "config.json").write_text("{}")
 
         # Act
-        with patch.object(sync_context, "COMMANDS_DIR", tmp_path):
-            commands = scan_commands()
+        commands = scan_commands()
 
         # Assert
         with check:
@@ -790,8 +827,7 @@ class TestScanCommands:
         )
 
         # Act
-        with patch.object(sync_context, "COMMANDS_DIR", tmp_path):
-            commands = scan_commands()
+        commands = scan_commands()
 
         # Assert
         with check:
@@ -808,36 +844,43 @@ class TestScanCommands:
 class TestLoadManifest:
     """Tests for load_manifest that reads manifest.json from disk."""
 
-    def test_load_manifest_existing_file_returns_parsed_json(self, tmp_path: Path) -> None:
-        """Existing valid manifest file should return parsed JSON dict.
+    @pytest.fixture(autouse=True)
+    def manifest_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Patch MANIFEST_PATH to a manifest.json in tmp_path for all tests in this class.
+
+        The file itself is not created.
 
         Args:
             tmp_path (Path): Pytest temporary directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+
+        Returns:
+            Path: The patched manifest.json path.
+        """
+        path = tmp_path / "manifest.json"
+        monkeypatch.setattr(sync_context, "MANIFEST_PATH", path)
+        return path
+
+    def test_load_manifest_existing_file_returns_parsed_json(self, manifest_path: Path) -> None:
+        """Existing valid manifest file should return parsed JSON dict.
+
+        Args:
+            manifest_path (Path): Patched manifest.json path fixture.
         """
         # Arrange
-        manifest_path = tmp_path / "manifest.json"
         manifest_data = {"version": "1.0.0", "skills": [{"name": "test"}]}
-        manifest_path.write_text(json.dumps(manifest_data))
+        manifest_path.write_text(json.dumps(manifest_data), encoding="utf-8")
 
         # Act
-        with patch.object(sync_context, "MANIFEST_PATH", manifest_path):
-            loaded = load_manifest()
+        loaded = load_manifest()
 
         # Assert
         assert loaded == manifest_data
 
-    def test_load_manifest_nonexistent_file_returns_default(self, tmp_path: Path) -> None:
-        """Non-existent manifest file should return the default manifest structure.
-
-        Args:
-            tmp_path (Path): Pytest temporary directory fixture.
-        """
-        # Arrange
-        nonexistent = tmp_path / "nonexistent.json"
-
+    def test_load_manifest_nonexistent_file_returns_default(self) -> None:
+        """Non-existent manifest file should return the default manifest structure."""
         # Act
-        with patch.object(sync_context, "MANIFEST_PATH", nonexistent):
-            loaded = load_manifest()
+        loaded = load_manifest()
 
         # Assert
         with check:
@@ -849,25 +892,18 @@ class TestLoadManifest:
         with check:
             assert loaded["skills"] == []
 
-    def test_load_manifest_default_not_corrupted_after_mutation(self, tmp_path: Path) -> None:
+    def test_load_manifest_default_not_corrupted_after_mutation(self) -> None:
         """Mutating a loaded default manifest must not corrupt subsequent loads.
 
-        load_manifest uses deepcopy so nested lists (skills, agents, commands)
-        are independent across calls. Without deepcopy, the shared _DEFAULT_MANIFEST
-        lists would be permanently corrupted.
-
-        Args:
-            tmp_path (Path): Pytest temporary directory fixture.
+        load_manifest parses the default from JSON text on every call so nested
+        lists (skills, agents, commands) are independent across calls. Sharing one
+        default dict would let those lists be permanently corrupted.
         """
-        # Arrange
-        nonexistent = tmp_path / "nonexistent.json"
+        # Act - load, directly mutate, then load again
+        first = load_manifest()
+        first["skills"].append({"name": "corrupted"})
 
-        with patch.object(sync_context, "MANIFEST_PATH", nonexistent):
-            # Act - load, directly mutate, then load again
-            first = load_manifest()
-            first["skills"].append({"name": "corrupted"})
-
-            second = load_manifest()
+        second = load_manifest()
 
         # Assert - second load must still have empty lists
         with check:
@@ -1112,12 +1148,11 @@ class TestGenerateClaudeMdSections:
         manifest: dict[str, Any] = {"skills": [], "agents": [], "commands": []}
 
         # Act
-        with patch.object(sync_context, "PROJECT_ROOT", Path("/nonexistent")):
-            sections = generate_claude_md_sections({}, {}, {}, manifest)
+        sections = generate_claude_md_sections({}, {}, {}, manifest)
 
         # Assert
         expected_keys = {"Commands", "Agents", "Context Bundles", "Skills"}
-        assert set(sections.keys()) == expected_keys
+        assert sections.keys() == expected_keys
 
     def test_generate_claude_md_sections_content_is_populated(self) -> None:
         """Sections should contain populated content, not just empty strings."""
@@ -1132,8 +1167,7 @@ class TestGenerateClaudeMdSections:
         commands = {"test-cmd": CommandInfo(name="test-cmd", description="Command")}
 
         # Act
-        with patch.object(sync_context, "PROJECT_ROOT", Path("/nonexistent")):
-            sections = generate_claude_md_sections(skills, agents, commands, manifest)
+        sections = generate_claude_md_sections(skills, agents, commands, manifest)
 
         # Assert - verify sections contain populated content, not just keys
         with check:
@@ -1162,7 +1196,7 @@ class TestGenerateCommandsSection:
         manifest: dict[str, Any] = {"commands": []}
 
         # Act
-        section = _generate_commands_section(commands, manifest)
+        section = _generate_commands_section(sorted(commands.items()), manifest)
 
         # Assert
         with check:
@@ -1181,7 +1215,7 @@ class TestGenerateCommandsSection:
         }
 
         # Act
-        section = _generate_commands_section(commands, manifest)
+        section = _generate_commands_section(sorted(commands.items()), manifest)
 
         # Assert
         assert "Manifest desc" in section
@@ -1189,7 +1223,7 @@ class TestGenerateCommandsSection:
     def test_generate_commands_section_empty_commands(self) -> None:
         """Empty commands should produce a table with only headers."""
         # Act
-        section = _generate_commands_section({}, {"commands": []})
+        section = _generate_commands_section([], {"commands": []})
 
         # Assert
         with check:
@@ -1216,7 +1250,7 @@ class TestGenerateAgentsSection:
         manifest: dict[str, Any] = {"agents": []}
 
         # Act
-        section = _generate_agents_section(agents, manifest)
+        section = _generate_agents_section(sorted(agents.items()), manifest)
 
         # Assert
         with check:
@@ -1235,7 +1269,7 @@ class TestGenerateAgentsSection:
         }
 
         # Act
-        section = _generate_agents_section(agents, manifest)
+        section = _generate_agents_section(sorted(agents.items()), manifest)
 
         # Assert
         assert "Manifest agent desc" in section
@@ -1257,7 +1291,7 @@ class TestGenerateBundlesSection:
         }
 
         # Act
-        section = _generate_bundles_section(agents)
+        section = _generate_bundles_section(sorted(agents.items()))
 
         # Assert
         with check:
@@ -1270,7 +1304,7 @@ class TestGenerateBundlesSection:
     def test_generate_bundles_section_includes_regenerate_instructions(self) -> None:
         """Bundles section should include regeneration instructions."""
         # Act
-        section = _generate_bundles_section({})
+        section = _generate_bundles_section([])
 
         # Assert
         with check:
@@ -1302,7 +1336,7 @@ class TestGenerateSkillsSection:
         }
 
         # Act
-        section = _generate_skills_section(skills, manifest)
+        section = _generate_skills_section(sorted(skills.items()), manifest)
 
         # Assert
         with check:
@@ -1323,7 +1357,7 @@ class TestGenerateSkillsSection:
         }
 
         # Act
-        section = _generate_skills_section(skills, manifest)
+        section = _generate_skills_section(sorted(skills.items()), manifest)
 
         # Assert
         with check:
@@ -1344,26 +1378,41 @@ class TestGenerateSkillsSection:
 class TestUpdateClaudeMd:
     """Tests for update_claude_md that replaces sections in CLAUDE.md."""
 
-    def test_update_claude_md_updates_changed_section(self, tmp_path: Path) -> None:
+    @pytest.fixture(autouse=True)
+    def claude_md(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Patch CLAUDE_MD_PATH to a CLAUDE.md in tmp_path for all tests in this class.
+
+        The file itself is not created.
+
+        Args:
+            tmp_path (Path): Pytest temporary directory fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+
+        Returns:
+            Path: The patched CLAUDE.md path.
+        """
+        path = tmp_path / "CLAUDE.md"
+        monkeypatch.setattr(sync_context, "CLAUDE_MD_PATH", path)
+        return path
+
+    def test_update_claude_md_updates_changed_section(self, claude_md: Path) -> None:
         """Section with changed content should be replaced and reported.
 
         Verifies the complete file content to ensure surrounding sections and
         section boundaries are preserved correctly.
 
         Args:
-            tmp_path (Path): Pytest temporary directory fixture.
+            claude_md (Path): Patched CLAUDE.md path fixture.
         """
         # Arrange
-        claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text("# Title\n\n## Commands\n\nOld content here\n\n---\n\n## Other\n\nStuff")
+        claude_md.write_text("# Title\n\n## Commands\n\nOld content here\n\n---\n\n## Other\n\nStuff", encoding="utf-8")
         sections = {"Commands": "New content here"}
 
         # Act
-        with patch.object(sync_context, "CLAUDE_MD_PATH", claude_md):
-            changes = update_claude_md(sections)
+        changes = update_claude_md(sections)
 
         # Assert
-        result = claude_md.read_text()
+        result = claude_md.read_text(encoding="utf-8")
         with check:
             assert len(changes) == 1
         with check:
@@ -1376,16 +1425,31 @@ class TestUpdateClaudeMd:
         with check:
             assert "## Other\n\nStuff" in result
 
-    def test_update_claude_md_multiple_sections_simultaneously(self, tmp_path: Path) -> None:
+    def test_update_claude_md_missing_file_reports_and_creates_nothing(self, claude_md: Path) -> None:
+        """Missing CLAUDE.md should be reported as a change without creating the file.
+
+        Args:
+            claude_md (Path): Patched CLAUDE.md path fixture.
+        """
+        # Act
+        changes = update_claude_md({"Commands": "New content here"})
+
+        # Assert
+        with check:
+            assert changes == ["CLAUDE.md does not exist"]
+        with check:
+            assert not claude_md.exists()
+
+    def test_update_claude_md_multiple_sections_simultaneously(self, claude_md: Path) -> None:
         """Updating multiple sections in one call should replace all of them.
 
         Args:
-            tmp_path (Path): Pytest temporary directory fixture.
+            claude_md (Path): Patched CLAUDE.md path fixture.
         """
         # Arrange
-        claude_md = tmp_path / "CLAUDE.md"
         claude_md.write_text(
-            "# Title\n\n## Commands\n\nOld commands\n\n---\n\n## Agents\n\nOld agents\n\n---\n\n## Footer\n\nEnd"
+            "# Title\n\n## Commands\n\nOld commands\n\n---\n\n## Agents\n\nOld agents\n\n---\n\n## Footer\n\nEnd",
+            encoding="utf-8",
         )
         sections = {
             "Commands": "New commands content",
@@ -1393,11 +1457,10 @@ class TestUpdateClaudeMd:
         }
 
         # Act
-        with patch.object(sync_context, "CLAUDE_MD_PATH", claude_md):
-            changes = update_claude_md(sections)
+        changes = update_claude_md(sections)
 
         # Assert
-        result = claude_md.read_text()
+        result = claude_md.read_text(encoding="utf-8")
         with check:
             assert len(changes) == 2
         with check:
@@ -1412,58 +1475,46 @@ class TestUpdateClaudeMd:
         with check:
             assert "## Footer\n\nEnd" in result
 
-    def test_update_claude_md_dry_run_does_not_write(self, tmp_path: Path) -> None:
+    def test_update_claude_md_dry_run_does_not_write(self, claude_md: Path) -> None:
         """Dry run should report changes but not modify the file.
 
         Args:
-            tmp_path (Path): Pytest temporary directory fixture.
+            claude_md (Path): Patched CLAUDE.md path fixture.
         """
         # Arrange
-        claude_md = tmp_path / "CLAUDE.md"
         original_content = "# Title\n\n## Commands\n\nOld content\n\n---\n"
-        claude_md.write_text(original_content)
+        claude_md.write_text(original_content, encoding="utf-8")
         sections = {"Commands": "New content"}
 
         # Act
-        with patch.object(sync_context, "CLAUDE_MD_PATH", claude_md):
-            changes = update_claude_md(sections, dry_run=True)
+        changes = update_claude_md(sections, dry_run=True)
 
         # Assert
         with check:
             assert len(changes) == 1
         with check:
-            assert claude_md.read_text() == original_content
+            assert claude_md.read_text(encoding="utf-8") == original_content
 
-    def test_update_claude_md_no_changes_when_content_matches(self, tmp_path: Path) -> None:
+    def test_update_claude_md_no_changes_when_content_matches(self, claude_md: Path) -> None:
         """Section with identical content should not report changes.
 
         Args:
-            tmp_path (Path): Pytest temporary directory fixture.
+            claude_md (Path): Patched CLAUDE.md path fixture.
         """
         # Arrange
-        claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text("# Title\n\n## Commands\n\nExact content\n\n---\n")
+        claude_md.write_text("# Title\n\n## Commands\n\nExact content\n\n---\n", encoding="utf-8")
         sections = {"Commands": "Exact content"}
 
         # Act
-        with patch.object(sync_context, "CLAUDE_MD_PATH", claude_md):
-            changes = update_claude_md(sections)
+        changes = update_claude_md(sections)
 
         # Assert
         assert changes == []
 
-    def test_update_claude_md_nonexistent_file_returns_error(self, tmp_path: Path) -> None:
-        """Non-existent CLAUDE.md should return an error message.
-
-        Args:
-            tmp_path (Path): Pytest temporary directory fixture.
-        """
-        # Arrange
-        nonexistent = tmp_path / "CLAUDE.md"
-
+    def test_update_claude_md_nonexistent_file_returns_error(self) -> None:
+        """Non-existent CLAUDE.md should return an error message."""
         # Act
-        with patch.object(sync_context, "CLAUDE_MD_PATH", nonexistent):
-            changes = update_claude_md({"Commands": "Content"})
+        changes = update_claude_md({"Commands": "Content"})
 
         # Assert
         with check:
@@ -1471,113 +1522,253 @@ class TestUpdateClaudeMd:
         with check:
             assert "does not exist" in changes[0]
 
-    def test_update_claude_md_nonexistent_section_returns_no_changes(self, tmp_path: Path) -> None:
+    def test_update_claude_md_nonexistent_section_returns_no_changes(self, claude_md: Path) -> None:
         """Section name not present in CLAUDE.md should silently return no changes.
 
         Documents intentional behavior: sections that don't exist in the file
         are silently skipped rather than raising an error.
 
         Args:
-            tmp_path (Path): Pytest temporary directory fixture.
+            claude_md (Path): Patched CLAUDE.md path fixture.
         """
         # Arrange
-        claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text("# Title\n\n## Commands\n\nContent\n\n---\n")
+        claude_md.write_text("# Title\n\n## Commands\n\nContent\n\n---\n", encoding="utf-8")
         sections = {"NonexistentSection": "New content"}
 
         # Act
-        with patch.object(sync_context, "CLAUDE_MD_PATH", claude_md):
-            changes = update_claude_md(sections)
+        changes = update_claude_md(sections)
 
         # Assert
         assert changes == []
 
 
+# ============================================================================
+# Test: _sections_pattern (private helper, tested for caching)
+# ============================================================================
+
+
+class TestSectionsPattern:
+    """Tests for _sections_pattern private helper that compiles section regexes."""
+
+    def test_sections_pattern_same_names_returns_cached_pattern(self) -> None:
+        """Repeated lookups for one set of section names should reuse the compiled pattern."""
+        # Act
+        first = sync_context._sections_pattern(("Commands", "Agents"))
+        second = sync_context._sections_pattern(("Commands", "Agents"))
+
+        # Assert
+        assert first is second
+
+    def test_sections_pattern_escapes_special_characters(self) -> None:
+        """Regex metacharacters in section names should be matched literally."""
+        # Arrange
+        content = "## C++ (Notes)\n\nBody\n\n---\n"
+
+        # Act
+        match = sync_context._sections_pattern(("C++ (Notes)",)).search(content)
+
+        # Assert
+        assert match is not None
+        assert match.group("body") == "Body"
+
+    def test_sections_pattern_adjacent_sections_all_match(self) -> None:
+        """Sections that directly follow one another should each be found in one scan."""
+        # Arrange
+        content = "## Agents\n\nA\n\n## Commands\n\nC\n"
+
+        # Act
+        matches = list(sync_context._sections_pattern(("Agents", "Commands")).finditer(content))
+
+        # Assert
+        assert [(m.group("name"), m.group("body")) for m in matches] == [("Agents", "A"), ("Commands", "C\n")]
+
+
 # ============================================================================
 # Test: regenerate_bundles
 # ============================================================================
 
 
 class TestRegenerateBundles:
-    """Tests for regenerate_bundles that runs the bundle generation script."""
+    """Tests for regenerate_bundles that runs bundle generation in-process."""
 
-    def test_regenerate_bundles_dry_run_returns_would_message(self) -> None:
-        """Dry run should return 'Would regenerate bundles' without running subprocess."""
+    @pytest.fixture(autouse=True)
+    def mock_generate(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Replace generate_all_bundles with a mock for all tests in this class.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+
+        Returns:
+            MagicMock: The mock standing in for generate_all_bundles.
+        """
+        mock = MagicMock()
+        monkeypatch.setattr(sync_context.generate_bundles, "generate_all_bundles", mock)
+        return mock
+
+    def test_regenerate_bundles_dry_run_returns_would_message(self, mock_generate: MagicMock) -> None:
+        """Dry run should return 'Would regenerate bundles' without generating anything.
+
+        Args:
+            mock_generate (MagicMock): Mocked generate_all_bundles fixture.
+        """
         # Act
         changes = regenerate_bundles(dry_run=True)
 
         # Assert
-        assert changes == ["Would regenerate bundles"]
+        with check:
+            assert changes == ["Would regenerate bundles"]
+        with check:
+            mock_generate.assert_not_called()
+
+    def test_regenerate_bundles_success_returns_regenerated_message(self, mock_generate: MagicMock) -> None:
+        """Successful in-process generation should return 'Regenerated bundles'.
+
+        Args:
+            mock_generate (MagicMock): Mocked generate_all_bundles fixture.
+        """
+        # Act
+        changes = regenerate_bundles()
+
+        # Assert
+        with check:
+            assert changes == ["Regenerated bundles"]
+        with check:
+            mock_generate.assert_called_once_with()
 
-    def test_regenerate_bundles_missing_script_returns_error(self, tmp_path: Path) -> None:
-        """Missing script should return error message.
+    def test_regenerate_bundles_captures_generator_output(
+        self, mock_generate: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Progress printed by the generator should not leak into sync output.
 
         Args:
-            tmp_path (Path): Pytest temporary directory fixture.
+            mock_generate (MagicMock): Mocked generate_all_bundles fixture.
+            capsys (pytest.CaptureFixture[str]): Pytest stdout/stderr capture fixture.
         """
         # Arrange
-        nonexistent_script = tmp_path / "generate_bundles.py"
+        mock_generate.side_effect = lambda: print("Generated: x.md")
 
         # Act
-        with patch.object(sync_context, "GENERATE_BUNDLES_SCRIPT", nonexistent_script):
-            changes = regenerate_bundles()
+        regenerate_bundles()
 
         # Assert
-        assert changes == ["generate_bundles.py not found"]
+        assert not capsys.readouterr().out
 
-    def test_regenerate_bundles_success_returns_regenerated_message(self, tmp_path: Path) -> None:
-        """Successful subprocess run should return 'Regenerated bundles'.
+    def test_regenerate_bundles_failure_returns_error_with_message(self, mock_generate: MagicMock) -> None:
+        """Failed generation should return error message with the exception text.
 
         Args:
-            tmp_path (Path): Pytest temporary directory fixture.
+            mock_generate (MagicMock): Mocked generate_all_bundles fixture.
         """
         # Arrange
-        script = tmp_path / "generate_bundles.py"
-        script.write_text("")
-        mock_result = MagicMock(returncode=0, stdout="", stderr="")
+        mock_generate.side_effect = FileNotFoundError("manifest.json missing")
 
         # Act
-        with (
-            patch.object(sync_context, "GENERATE_BUNDLES_SCRIPT", script),
-            patch("sync_context.subprocess.run", return_value=mock_result) as mock_run,
-        ):
-            changes = regenerate_bundles()
+        changes = regenerate_bundles()
 
         # Assert
         with check:
-            assert changes == ["Regenerated bundles"]
-        with check:
-            assert mock_run.call_args[0][0] == ["uv", "run", "python", str(script)]
+            assert len(changes) == 1
         with check:
-            assert mock_run.call_args[1]["cwd"] == sync_context.PROJECT_ROOT
+            assert "Bundle generation failed" in changes[0]
         with check:
-            assert mock_run.call_args[1]["capture_output"] is True
+            assert "manifest.json missing" in changes[0]
+
+    def test_regenerate_bundles_unexpected_error_returns_error_message(self, mock_generate: MagicMock) -> None:
+        """Errors outside the I/O and parsing family should also be reported rather than raised.
+
+        Args:
+            mock_generate (MagicMock): Mocked generate_all_bundles fixture.
+        """
+        # Arrange - e.g. a manifest agent whose depends_on_skills is not a list
+        mock_generate.side_effect = TypeError("'int' object is not iterable")
+
+        # Act
+        changes = regenerate_bundles()
+
+        # Assert
+        assert changes == ["Bundle generation failed: 'int' object is not iterable"]
+
+
+# ============================================================================
+# Test: check_bundles
+# ============================================================================
+
+
+class TestCheckBundles:
+    """Tests for check_bundles that reports agents with stale bundles."""
+
+    @pytest.fixture
+    def manifest(self) -> dict[str, Any]:
+        """Build a manifest with two agents depending on different skills.
+
+        Returns:
+            dict[str, Any]: The manifest dict.
+        """
+        return {
+            "skills": [{"name": "skill-a"}, {"name": "skill-b"}],
+            "agents": [
+                {"name": "agent-a", "depends_on_skills": ["skill-a"]},
+                {"name": "agent-b", "depends_on_skills": ["skill-b"]},
+            ],
+        }
 
-    def test_regenerate_bundles_failure_returns_error_with_stderr(self, tmp_path: Path) -> None:
-        """Failed subprocess should return error message with stderr content.
+    @pytest.fixture
+    def skills_root(self, tmp_path: Path, manifest: dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Generate real bundles in a temporary tree, dated as if freshly checked out.
 
         Args:
             tmp_path (Path): Pytest temporary directory fixture.
+            manifest (dict[str, Any]): Two-agent manifest fixture.
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+
+        Returns:
+            Path: The temporary skills directory.
+        """
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+        for skill in ("skill-a", "skill-b"):
+            _write_skill(tmp_path / "skills" / skill, f"name: {skill}", f"# {skill}\n\nContent.\n")
+        bundles_dir = tmp_path / "bundles"
+
+        monkeypatch.setattr(sync_context.generate_bundles, "CLAUDE_DIR", tmp_path)
+        monkeypatch.setattr(sync_context.generate_bundles, "MANIFEST_PATH", manifest_path)
+        monkeypatch.setattr(sync_context.generate_bundles, "SKILLS_DIR", tmp_path / "skills")
+        monkeypatch.setattr(sync_context.generate_bundles, "BUNDLES_DIR", bundles_dir)
+        sync_context.generate_bundles.generate_all_bundles(force=True)
+
+        # A checkout does not leave bundles newer than their inputs
+        for bundle in bundles_dir.glob("*.md"):
+            os.utime(bundle, ns=(0, 0))
+        return tmp_path / "skills"
+
+    @pytest.mark.usefixtures("skills_root")
+    def test_check_bundles_identical_bundles_returns_empty(self, manifest: dict[str, Any]) -> None:
+        """Bundles with current content should pass even when older than their inputs.
+
+        Args:
+            manifest (dict[str, Any]): Two-agent manifest fixture.
+        """
+        # Act
+        changes = check_bundles(manifest)
+
+        # Assert
+        assert changes == []
+
+    def test_check_bundles_reports_only_stale_agents(self, skills_root: Path, manifest: dict[str, Any]) -> None:
+        """Only the agent whose skill content changed should be reported.
+
+        Args:
+            skills_root (Path): Temporary skills directory fixture.
+            manifest (dict[str, Any]): Two-agent manifest fixture.
         """
         # Arrange
-        script = tmp_path / "generate_bundles.py"
-        script.write_text("")
-        mock_result = MagicMock(returncode=1, stdout="", stderr="ImportError: no module")
+        _write_skill(skills_root / "skill-b", "name: skill-b", "# skill-b\n\nEdited.\n")
 
         # Act
-        with (
-            patch.object(sync_context, "GENERATE_BUNDLES_SCRIPT", script),
-            patch("sync_context.subprocess.run", return_value=mock_result),
-        ):
-            changes = regenerate_bundles()
+        changes = check_bundles(manifest)
 
         # Assert
-        with check:
-            assert len(changes) == 1
-        with check:
-            assert "Bundle generation failed" in changes[0]
-        with check:
-            assert "ImportError" in changes[0]
+        assert changes == ["Bundles out of date: agent-b"]
 
 
 # ============================================================================
@@ -1620,6 +1811,50 @@ class TestSyncSkillsHelper:
         with check:
             assert len(changes) == 1
 
+    def test_sync_skills_same_names_keeps_entries_in_disk_order(self) -> None:
+        """Unchanged skill names should keep existing entries, ordered as found on disk."""
+        # Arrange
+        manifest: dict[str, Any] = {
+            "skills": [
+                {"name": "b", "description": "Manifest B"},
+                {"name": "a", "description": "Manifest A"},
+            ]
+        }
+        skills = {
+            "a": SkillInfo(name="a", description="Disk A"),
+            "b": SkillInfo(name="b", description="Disk B"),
+        }
+
+        # Act
+        new_skills, changes = sync_context._sync_skills(manifest, skills)
+
+        # Assert
+        with check:
+            assert [s["description"] for s in new_skills] == ["Manifest A", "Manifest B"]
+        with check:
+            assert changes == []
+
+    def test_sync_skills_added_and_removed_reports_in_order(self) -> None:
+        """Additions should be reported in disk order, followed by removals in manifest order."""
+        # Arrange
+        manifest: dict[str, Any] = {"skills": [{"name": "old-2"}, {"name": "kept"}, {"name": "old-1"}]}
+        skills = {
+            "kept": SkillInfo(name="kept", description="Kept"),
+            "new-2": SkillInfo(name="new-2", description="New"),
+            "new-1": SkillInfo(name="new-1", description="New"),
+        }
+
+        # Act
+        _, changes = sync_context._sync_skills(manifest, skills)
+
+        # Assert
+        assert changes == [
+            "Added skill: new-2",
+            "Added skill: new-1",
+            "Removed skill: old-2",
+            "Removed skill: old-1",
+        ]
+
 
 # ============================================================================
 # Test: _sync_agents (private helper, tested for edge cases)
@@ -1770,6 +2005,86 @@ class TestMain:
         # Assert
         assert result == 0
 
+    def test_main_check_manifest_changes_skip_claude_md(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """--check should stop after the manifest stage once it reports changes.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+        """
+        # Arrange
+        monkeypatch.setattr("sys.argv", ["sync_context.py", "--check"])
+        monkeypatch.setattr(
+            sync_context,
+            "update_manifest",
+            lambda m, _s, _a, _c: (m, ["Added skill: test"]),
+        )
+        mock_update_claude_md = MagicMock(return_value=[])
+        monkeypatch.setattr(sync_context, "update_claude_md", mock_update_claude_md)
+        mock_regenerate = MagicMock(return_value=[])
+        monkeypatch.setattr(sync_context, "regenerate_bundles", mock_regenerate)
+
+        # Act
+        result = sync_context.main()
+
+        # Assert
+        with check:
+            assert result == 1
+        with check:
+            mock_update_claude_md.assert_not_called()
+        with check:
+            mock_regenerate.assert_not_called()
+
+    def test_main_check_skips_bundles_unless_requested(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """--check should only consider bundles when --check-bundles is also given.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+        """
+        # Arrange
+        monkeypatch.setattr(sync_context, "update_manifest", lambda m, _s, _a, _c: (m, []))
+        monkeypatch.setattr(sync_context, "update_claude_md", lambda _sections, **_kwargs: [])
+        mock_check_bundles = MagicMock(return_value=["Bundles out of date: agent-a"])
+        monkeypatch.setattr(sync_context, "check_bundles", mock_check_bundles)
+        mock_regenerate = MagicMock(return_value=[])
+        monkeypatch.setattr(sync_context, "regenerate_bundles", mock_regenerate)
+
+        # Act
+        monkeypatch.setattr("sys.argv", ["sync_context.py", "--check"])
+        plain_result = sync_context.main()
+        plain_calls = mock_check_bundles.call_count
+        monkeypatch.setattr("sys.argv", ["sync_context.py", "--check", "--check-bundles"])
+        bundles_result = sync_context.main()
+
+        # Assert
+        with check:
+            assert plain_result == 0
+        with check:
+            assert plain_calls == 0
+        with check:
+            assert bundles_result == 1
+        with check:
+            mock_check_bundles.assert_called_once()
+        with check:
+            mock_regenerate.assert_not_called()
+
+    def test_main_check_bundles_current_returns_0(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """--check --check-bundles should pass when every agent's bundles are up to date.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Monkeypatch fixture.
+        """
+        # Arrange
+        monkeypatch.setattr("sys.argv", ["sync_context.py", "--check", "--check-bundles"])
+        monkeypatch.setattr(sync_context, "update_manifest", lambda m, _s, _a, _c: (m, []))
+        monkeypatch.setattr(sync_context, "update_claude_md", lambda _sections, **_kwargs: [])
+        monkeypatch.setattr(sync_context, "check_bundles", lambda _manifest: [])
+
+        # Act
+        result = sync_context.main()
+
+        # Assert
+        assert result == 0
+
     def test_main_dry_run_does_not_write_manifest(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """--dry-run should not write manifest to disk even when changes exist.
 
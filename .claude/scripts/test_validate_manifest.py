@@ -23,10 +23,12 @@ from pytest_check import check
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_manifest() -> dict[str, Any]:
     """Provide a valid manifest with all required fields and valid references.
 
+    Shared by every test in the module, so tests must not mutate it.
+
     Returns:
         dict[str, Any]: A complete, valid manifest structure.
     """
@@ -72,18 +74,18 @@ def valid_manifest() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
-def manifest_file(tmp_path: Path, valid_manifest: dict[str, Any]) -> Path:
-    """Create a temporary manifest file.
+@pytest.fixture(scope="module")
+def manifest_file(tmp_path_factory: pytest.TempPathFactory, valid_manifest: dict[str, Any]) -> Path:
+    """Create a temporary manifest file, once per module.
 
     Args:
-        tmp_path (Path): Pytest temporary directory fixture.
+        tmp_path_factory (pytest.TempPathFactory): Pytest session temporary directory factory.
         valid_manifest (dict[str, Any]): The valid manifest fixture.
 
     Returns:
         Path: Path to the temporary manifest file.
     """
-    manifest_path = tmp_path / "manifest.json"
+    manifest_path = tmp_path_factory.mktemp("manifest") / "manifest.json"
     manifest_path.write_text(json.dumps(valid_manifest, indent=2))
     return manifest_path
 
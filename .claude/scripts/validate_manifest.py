@@ -60,8 +60,7 @@ def load_manifest() -> dict[str, Any] | None:
             fails.
     """
     try:
-        with MANIFEST_PATH.open() as f:
-            return json.load(f)
+        return json.loads(MANIFEST_PATH.read_bytes())
     except json.JSONDecodeError as e:
         print(f"JSON syntax error: {e}", file=sys.stderr)
         return None